@@ -46,11 +46,15 @@ def list_users(
     role: UserRole | None = None,
     search: str | None = None,
     skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100),
+    limit: int = Query(50, ge=0, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role(UserRole.ADMIN)),
 ):
-    """List all users with optional role filter and search."""
+    """List all users with optional role filter and search.
+
+    ``limit=0`` returns only ``total`` (an empty page), for callers that
+    just need the count.
+    """
     query = db.query(User)
 
     if role:
@@ -66,7 +70,9 @@ def list_users(
         )
 
     total = query.count()
-    users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
+    users = []
+    if limit:
+        users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
 
     return AdminUserList(users=users, total=total)
 
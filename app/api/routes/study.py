@@ -287,10 +287,14 @@ def get_children_course_ids(db: Session, parent_id: int, student_user_id: int |
     return [r[0] for r in enrolled]
 
 
+_OPENING_FENCE_RE = re.compile(r"^```(?:json)?\s*\n?")
+_CLOSING_FENCE_RE = re.compile(r"\n?```\s*$")
+
+
 def strip_json_fences(text: str) -> str:
     """Strip markdown code fences (```json ... ```) from AI responses."""
-    stripped = re.sub(r"^```(?:json)?\s*\n?", "", text.strip())
-    stripped = re.sub(r"\n?```\s*$", "", stripped)
+    stripped = _OPENING_FENCE_RE.sub("", text.strip())
+    stripped = _CLOSING_FENCE_RE.sub("", stripped)
     return stripped.strip()
 
 
@@ -500,10 +504,10 @@ def auto_create_tasks_from_dates(
     from app.core.logging_config import get_logger
     logger = get_logger(__name__)
 
-    created_tasks = []
     now = datetime.now(timezone.utc)
     one_year_ago = now - timedelta(days=365)
 
+    valid_dates = []
     for d in dates:
         try:
             due_date = datetime.strptime(d["date"], "%Y-%m-%d").replace(hour=12, tzinfo=timezone.utc)
@@ -517,59 +521,73 @@ def auto_create_tasks_from_dates(
             logger.warning(f"Skipping historical date in auto-task creation: {d.get('date')} '{d.get('title')}'")
             continue
 
-        # Determine who the task should be assigned to
-        assigned_to = None
-        if user.role == UserRole.PARENT:
-            child_ids = get_linked_children_user_ids(db, user.id)
-            if child_ids and course_id:
-                # Find which child is enrolled in the source course
-                enrolled_child = db.query(Student.user_id).join(
-                    student_courses, Student.id == student_courses.c.student_id
-                ).filter(
-                    student_courses.c.course_id == course_id,
-                    Student.user_id.in_(child_ids),
-                ).first()
-                assigned_to = enrolled_child[0] if enrolled_child else child_ids[0]
-            elif child_ids:
-                assigned_to = child_ids[0]
-
-        # Resolve legacy student_id from assigned user (required by prod DB schema)
-        legacy_student_id = None
-        if assigned_to:
-            student_rec = db.query(Student).filter(Student.user_id == assigned_to).first()
-            if student_rec:
-                legacy_student_id = student_rec.id
-
         priority = d.get("priority", "medium")
         if priority not in ("low", "medium", "high"):
             priority = "medium"
+        valid_dates.append((d, due_date, priority))
 
-        try:
-            task = Task(
-                title=d["title"],
-                description=f"Auto-created from class material generation",
-                due_date=due_date,
-                priority=priority,
-                created_by_user_id=user.id,
-                assigned_to_user_id=assigned_to,
-                parent_id=user.id,
-                student_id=legacy_student_id,
-                study_guide_id=study_guide_id,
-                course_id=course_id,
-                course_content_id=course_content_id,
-            )
-            db.add(task)
-            db.flush()
-            created_tasks.append({
-                "id": task.id,
-                "title": task.title,
-                "due_date": d["date"],
-                "priority": priority,
-            })
-            logger.info(f"Auto-created task '{task.title}' due {d['date']} from study guide {study_guide_id}")
-        except Exception:
-            logger.exception(f"Failed to auto-create task '{d.get('title')}' for study guide {study_guide_id}")
-            db.rollback()
+    if not valid_dates:
+        return []
+
+    # Determine who the tasks should be assigned to. This depends only on the
+    # user and course, not on the date, so resolve it once for the whole batch.
+    assigned_to = None
+    if user.role == UserRole.PARENT:
+        child_ids = get_linked_children_user_ids(db, user.id)
+        if child_ids and course_id:
+            # Find which child is enrolled in the source course
+            enrolled_child = db.query(Student.user_id).join(
+                student_courses, Student.id == student_courses.c.student_id
+            ).filter(
+                student_courses.c.course_id == course_id,
+                Student.user_id.in_(child_ids),
+            ).first()
+            assigned_to = enrolled_child[0] if enrolled_child else child_ids[0]
+        elif child_ids:
+            assigned_to = child_ids[0]
+
+    # Resolve legacy student_id from assigned user (required by prod DB schema)
+    legacy_student_id = None
+    if assigned_to:
+        student_rec = db.query(Student).filter(Student.user_id == assigned_to).first()
+        if student_rec:
+            legacy_student_id = student_rec.id
+
+    tasks = [
+        Task(
+            title=d["title"],
+            description=f"Auto-created from class material generation",
+            due_date=due_date,
+            priority=priority,
+            created_by_user_id=user.id,
+            assigned_to_user_id=assigned_to,
+            parent_id=user.id,
+            student_id=legacy_student_id,
+            study_guide_id=study_guide_id,
+            course_id=course_id,
+            course_content_id=course_content_id,
+        )
+        for d, due_date, priority in valid_dates
+    ]
+    # One flush for the batch: on PostgreSQL SQLAlchemy sends the rows as a
+    # single multi-row INSERT ... RETURNING instead of one round-trip per task.
+    try:
+        db.add_all(tasks)
+        db.flush()
+    except Exception:
+        logger.exception(f"Failed to auto-create {len(tasks)} task(s) for study guide {study_guide_id}")
+        db.rollback()
+        return []
+
+    created_tasks = []
+    for task, (d, _, priority) in zip(tasks, valid_dates):
+        created_tasks.append({
+            "id": task.id,
+            "title": task.title,
+            "due_date": d["date"],
+            "priority": priority,
+        })
+        logger.info(f"Auto-created task '{task.title}' due {d['date']} from study guide {study_guide_id}")
 
     return created_tasks
 
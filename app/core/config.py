@@ -28,6 +28,10 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 2
 
+    # bcrypt work factor for new password hashes. The test suite sets
+    # BCRYPT_ROUNDS=4; production refuses anything below 12 (see below).
+    bcrypt_rounds: int = 12
+
     # Security token TTLs
     pwd_reset_token_expire_hours: int = 1
     email_verify_token_expire_hours: int = 4
@@ -189,3 +193,12 @@ if settings.secret_key in _KNOWN_WEAK_KEYS:
         )
     # Development: generate a random key so the app can start
     settings.secret_key = _generate_dev_secret()
+
+# Validate password hashing cost
+_MIN_PRODUCTION_BCRYPT_ROUNDS = 12
+
+if settings.environment == "production" and settings.bcrypt_rounds < _MIN_PRODUCTION_BCRYPT_ROUNDS:
+    raise RuntimeError(
+        f"BCRYPT_ROUNDS={settings.bcrypt_rounds} is too low for production "
+        f"(minimum {_MIN_PRODUCTION_BCRYPT_ROUNDS})."
+    )
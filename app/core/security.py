@@ -19,6 +19,11 @@ _PASSWORD_PATTERN = re.compile(
 # start with "$2b$" so this value will never match any real password check.
 UNUSABLE_PASSWORD_HASH = "!INVITE_PENDING"
 
+# bcrypt work factor for newly created hashes (BCRYPT_ROUNDS env var).
+# Verification reads the cost from the stored hash, so lowering this (the test
+# suite does) never breaks existing logins.
+BCRYPT_ROUNDS = settings.bcrypt_rounds
+
 
 def validate_password_strength(password: str) -> str | None:
     """Return an error message if the password is too weak, or None if OK."""
@@ -41,7 +46,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(
         password.encode("utf-8"),
-        bcrypt.gensalt()
+        bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     ).decode("utf-8")
 
 
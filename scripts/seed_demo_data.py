@@ -16,7 +16,7 @@ from datetime import datetime, timedelta, timezone
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, select, text
 from sqlalchemy.orm import sessionmaker
 
 from app.core.security import get_password_hash
@@ -57,28 +57,25 @@ def seed(force: bool = False, database_url: str | None = None):
             return
 
         if force:
-            # Delete all tables in dependency order
-            db.query(Message).delete()
-            db.query(Conversation).delete()
-            db.query(StudentAssignment).delete()
-            db.query(StudyGuide).delete()
-            db.query(Assignment).delete()
-            db.query(Notification).delete()
-            db.query(Task).delete()
-            db.query(CourseContent).delete()
-            db.execute(student_courses.delete())
-            db.execute(student_teachers.delete())
-            db.execute(parent_students.delete())
-            db.query(Course).delete()
-            db.query(TeacherGoogleAccount).delete()
-            db.query(TeacherCommunication).delete()
-            db.query(TokenBlacklist).delete()
-            db.query(AuditLog).delete()
-            db.query(Invite).delete()
-            db.query(Broadcast).delete()
-            db.query(Student).delete()
-            db.query(Teacher).delete()
-            db.query(User).delete()
+            # Wipe seeded tables, listed in dependency order
+            tables = [
+                Message.__table__, Conversation.__table__, StudentAssignment.__table__,
+                StudyGuide.__table__, Assignment.__table__, Notification.__table__,
+                Task.__table__, CourseContent.__table__, student_courses,
+                student_teachers, parent_students, Course.__table__,
+                TeacherGoogleAccount.__table__, TeacherCommunication.__table__,
+                TokenBlacklist.__table__, AuditLog.__table__, Invite.__table__,
+                Broadcast.__table__, Student.__table__, Teacher.__table__, User.__table__,
+            ]
+            if eng.dialect.name == "postgresql":
+                # One statement, one lock; CASCADE also clears any other
+                # table still referencing these rows.
+                db.execute(text(
+                    f"TRUNCATE {', '.join(t.name for t in tables)} RESTART IDENTITY CASCADE"
+                ))
+            else:
+                for table in tables:
+                    db.execute(table.delete())
             db.commit()
 
         pw = get_password_hash(DEMO_PASSWORD)
@@ -122,82 +119,42 @@ def seed(force: bool = False, database_url: str | None = None):
         )
         db.add_all([admin, t1_user, t2_user, p1_user, p2_user, p3_user,
                      s1_user, s2_user, s3_user])
-        db.flush()
 
         # ── Teacher profiles ──────────────────────────────────
         t1 = Teacher(
-            user_id=t1_user.id, school_name="Maple Ridge Academy",
+            user=t1_user, school_name="Maple Ridge Academy",
             department="Science & Math", teacher_type=TeacherType.SCHOOL_TEACHER,
         )
         t2 = Teacher(
-            user_id=t2_user.id, school_name="Maple Ridge Academy",
+            user=t2_user, school_name="Maple Ridge Academy",
             department="Humanities", teacher_type=TeacherType.SCHOOL_TEACHER,
         )
         db.add_all([t1, t2])
-        db.flush()
 
         # ── Student profiles ─────────────────────────────────
-        s1 = Student(user_id=s1_user.id, grade_level=8, school_name="Maple Ridge Academy")
-        s2 = Student(user_id=s2_user.id, grade_level=8, school_name="Maple Ridge Academy")
-        s3 = Student(user_id=s3_user.id, grade_level=7, school_name="Maple Ridge Academy")
+        s1 = Student(user=s1_user, grade_level=8, school_name="Maple Ridge Academy")
+        s2 = Student(user=s2_user, grade_level=8, school_name="Maple Ridge Academy")
+        s3 = Student(user=s3_user, grade_level=7, school_name="Maple Ridge Academy")
         db.add_all([s1, s2, s3])
-        db.flush()
-
-        # ── Parent-Student links ──────────────────────────────
-        for parent_id, student_id, rel in [
-            (p1_user.id, s1.id, RelationshipType.MOTHER),
-            (p2_user.id, s2.id, RelationshipType.FATHER),
-            (p3_user.id, s3.id, RelationshipType.MOTHER),
-        ]:
-            db.execute(parent_students.insert().values(
-                parent_id=parent_id, student_id=student_id,
-                relationship_type=rel,
-            ))
-
-        # ── Student-Teacher links ─────────────────────────────
-        for sid, tuser, tname, temail, added_by in [
-            (s1.id, t1_user.id, "Sarah Chen", "sarah.chen@classbridge.local", p1_user.id),
-            (s1.id, t2_user.id, "James Wilson", "james.wilson@classbridge.local", p1_user.id),
-            (s2.id, t1_user.id, "Sarah Chen", "sarah.chen@classbridge.local", p2_user.id),
-            (s2.id, t2_user.id, "James Wilson", "james.wilson@classbridge.local", p2_user.id),
-            (s3.id, t1_user.id, "Sarah Chen", "sarah.chen@classbridge.local", p3_user.id),
-        ]:
-            db.execute(student_teachers.insert().values(
-                student_id=sid, teacher_user_id=tuser,
-                teacher_name=tname, teacher_email=temail,
-                added_by_user_id=added_by,
-            ))
 
         # ── Courses ───────────────────────────────────────────
         c_sci = Course(
-            name="Science 8", subject="Science", teacher_id=t1.id,
+            name="Science 8", subject="Science", teacher=t1,
             description="Grade 8 Science: cells, ecosystems, and energy.",
         )
         c_math = Course(
-            name="Mathematics 8", subject="Mathematics", teacher_id=t1.id,
+            name="Mathematics 8", subject="Mathematics", teacher=t1,
             description="Grade 8 Math: linear equations, geometry, and data analysis.",
         )
         c_eng = Course(
-            name="English Language Arts 8", subject="English", teacher_id=t2.id,
+            name="English Language Arts 8", subject="English", teacher=t2,
             description="Grade 8 ELA: literature analysis, persuasive writing, and grammar.",
         )
         c_ss = Course(
-            name="Social Studies 8", subject="Social Studies", teacher_id=t2.id,
+            name="Social Studies 8", subject="Social Studies", teacher=t2,
             description="Grade 8 Social Studies: world history and geography.",
         )
         db.add_all([c_sci, c_math, c_eng, c_ss])
-        db.flush()
-
-        # ── Enroll students in courses ────────────────────────
-        for course in [c_sci, c_math, c_eng, c_ss]:
-            for student in [s1, s2]:
-                db.execute(student_courses.insert().values(
-                    student_id=student.id, course_id=course.id,
-                ))
-        for course in [c_sci, c_math, c_eng]:
-            db.execute(student_courses.insert().values(
-                student_id=s3.id, course_id=course.id,
-            ))
 
         # ── Assignments ───────────────────────────────────────
         t = _now()
@@ -205,291 +162,332 @@ def seed(force: bool = False, database_url: str | None = None):
             Assignment(
                 title="Cell Structure Lab Report",
                 description="Draw and label plant and animal cells. Include at least 8 organelles.",
-                course_id=c_sci.id, due_date=t - timedelta(days=3), max_points=100,
+                course=c_sci, due_date=t - timedelta(days=3), max_points=100,
             ),
             Assignment(
                 title="Photosynthesis Quiz",
                 description="Short quiz on the light and dark reactions of photosynthesis.",
-                course_id=c_sci.id, due_date=t + timedelta(days=2), max_points=50,
+                course=c_sci, due_date=t + timedelta(days=2), max_points=50,
             ),
             Assignment(
                 title="Ecosystem Diorama Project",
                 description="Build a diorama of a biome and present to the class.",
-                course_id=c_sci.id, due_date=t + timedelta(days=10), max_points=150,
+                course=c_sci, due_date=t + timedelta(days=10), max_points=150,
             ),
         ]
         math_assignments = [
             Assignment(
                 title="Linear Equations Worksheet",
                 description="Solve 20 linear equations. Show all work.",
-                course_id=c_math.id, due_date=t - timedelta(days=5), max_points=40,
+                course=c_math, due_date=t - timedelta(days=5), max_points=40,
             ),
             Assignment(
                 title="Slope and Intercept Test",
                 description="Unit test covering slope, y-intercept, and graphing lines.",
-                course_id=c_math.id, due_date=t + timedelta(days=3), max_points=100,
+                course=c_math, due_date=t + timedelta(days=3), max_points=100,
             ),
             Assignment(
                 title="Data Analysis Project",
                 description="Collect survey data, create graphs, and interpret trends.",
-                course_id=c_math.id, due_date=t + timedelta(days=14), max_points=60,
+                course=c_math, due_date=t + timedelta(days=14), max_points=60,
             ),
         ]
         eng_assignments = [
             Assignment(
                 title="Book Report: The Giver",
                 description="Write a 3-page report on themes and character development.",
-                course_id=c_eng.id, due_date=t - timedelta(days=1), max_points=100,
+                course=c_eng, due_date=t - timedelta(days=1), max_points=100,
             ),
             Assignment(
                 title="Persuasive Essay Draft",
                 description="First draft of a persuasive essay on a topic of your choice.",
-                course_id=c_eng.id, due_date=t + timedelta(days=5), max_points=75,
+                course=c_eng, due_date=t + timedelta(days=5), max_points=75,
             ),
             Assignment(
                 title="Grammar Review Exercises",
                 description="Complete exercises on subject-verb agreement and punctuation.",
-                course_id=c_eng.id, due_date=t + timedelta(days=7), max_points=30,
+                course=c_eng, due_date=t + timedelta(days=7), max_points=30,
             ),
             Assignment(
                 title="Poetry Analysis",
                 description="Analyze two poems and compare the literary devices used.",
-                course_id=c_eng.id, due_date=t + timedelta(days=18), max_points=80,
+                course=c_eng, due_date=t + timedelta(days=18), max_points=80,
             ),
         ]
         ss_assignments = [
             Assignment(
                 title="Ancient Civilizations Timeline",
                 description="Create an illustrated timeline of Mesopotamia, Egypt, and Greece.",
-                course_id=c_ss.id, due_date=t - timedelta(days=7), max_points=50,
+                course=c_ss, due_date=t - timedelta(days=7), max_points=50,
             ),
             Assignment(
                 title="Geography Map Quiz",
                 description="Label countries, capitals, and major rivers on a blank map.",
-                course_id=c_ss.id, due_date=t + timedelta(days=1), max_points=40,
+                course=c_ss, due_date=t + timedelta(days=1), max_points=40,
             ),
             Assignment(
                 title="Research Paper Outline",
                 description="Submit a detailed outline for the historical research paper.",
-                course_id=c_ss.id, due_date=t + timedelta(days=12), max_points=60,
+                course=c_ss, due_date=t + timedelta(days=12), max_points=60,
             ),
         ]
         all_assignments = sci_assignments + math_assignments + eng_assignments + ss_assignments
         db.add_all(all_assignments)
-        db.flush()
 
         # ── Grades for past-due assignments ───────────────────
         grades = [
             StudentAssignment(
-                student_id=s1.id, assignment_id=sci_assignments[0].id,
+                student=s1, assignment=sci_assignments[0],
                 grade=92, status="graded", submitted_at=t - timedelta(days=4),
             ),
             StudentAssignment(
-                student_id=s1.id, assignment_id=math_assignments[0].id,
+                student=s1, assignment=math_assignments[0],
                 grade=36, status="graded", submitted_at=t - timedelta(days=6),
             ),
             StudentAssignment(
-                student_id=s1.id, assignment_id=eng_assignments[0].id,
+                student=s1, assignment=eng_assignments[0],
                 grade=88, status="graded", submitted_at=t - timedelta(days=2),
             ),
             StudentAssignment(
-                student_id=s1.id, assignment_id=ss_assignments[0].id,
+                student=s1, assignment=ss_assignments[0],
                 grade=45, status="graded", submitted_at=t - timedelta(days=8),
             ),
             StudentAssignment(
-                student_id=s2.id, assignment_id=sci_assignments[0].id,
+                student=s2, assignment=sci_assignments[0],
                 grade=85, status="graded", submitted_at=t - timedelta(days=4),
             ),
             StudentAssignment(
-                student_id=s2.id, assignment_id=math_assignments[0].id,
+                student=s2, assignment=math_assignments[0],
                 grade=38, status="graded", submitted_at=t - timedelta(days=6),
             ),
             StudentAssignment(
-                student_id=s2.id, assignment_id=eng_assignments[0].id,
+                student=s2, assignment=eng_assignments[0],
                 status="submitted", submitted_at=t - timedelta(days=1),
             ),
             StudentAssignment(
-                student_id=s2.id, assignment_id=ss_assignments[0].id,
+                student=s2, assignment=ss_assignments[0],
                 grade=48, status="graded", submitted_at=t - timedelta(days=8),
             ),
             StudentAssignment(
-                student_id=s3.id, assignment_id=sci_assignments[0].id,
+                student=s3, assignment=sci_assignments[0],
                 grade=78, status="graded", submitted_at=t - timedelta(days=3),
             ),
             StudentAssignment(
-                student_id=s3.id, assignment_id=math_assignments[0].id,
+                student=s3, assignment=math_assignments[0],
                 grade=32, status="graded", submitted_at=t - timedelta(days=5),
             ),
             StudentAssignment(
-                student_id=s3.id, assignment_id=eng_assignments[0].id,
+                student=s3, assignment=eng_assignments[0],
                 status="pending",
             ),
         ]
         db.add_all(grades)
 
-        # ── Conversations & Messages ──────────────────────────
+        # ── Conversations ─────────────────────────────────────
         conv1 = Conversation(
-            participant_1_id=t1_user.id, participant_2_id=p1_user.id,
-            student_id=s1.id, subject="Aiden's progress in Science",
+            participant_1=t1_user, participant_2=p1_user,
+            student=s1, subject="Aiden's progress in Science",
         )
         conv2 = Conversation(
-            participant_1_id=t2_user.id, participant_2_id=p2_user.id,
-            student_id=s2.id, subject="Sofia's English paper",
+            participant_1=t2_user, participant_2=p2_user,
+            student=s2, subject="Sofia's English paper",
         )
         conv3 = Conversation(
-            participant_1_id=t1_user.id, participant_2_id=p3_user.id,
-            student_id=s3.id, subject="Upcoming Math test preparation",
+            participant_1=t1_user, participant_2=p3_user,
+            student=s3, subject="Upcoming Math test preparation",
         )
         db.add_all([conv1, conv2, conv3])
+
+        # ── Tasks ─────────────────────────────────────────────
+        tasks = [
+            Task(
+                creator=p1_user, assignee=p1_user,
+                title="Review Aiden's science project outline",
+                description="Help Aiden choose a biome for his ecosystem diorama and gather materials.",
+                due_date=t + timedelta(days=5), priority="medium", category="Schoolwork",
+            ),
+            Task(
+                creator=p1_user, assignee=p1_user,
+                title="Buy poster board for diorama",
+                description="Pick up supplies from the craft store for the ecosystem project.",
+                due_date=t + timedelta(days=7), priority="low", category="Shopping",
+            ),
+            Task(
+                creator=p2_user, assignee=p2_user,
+                title="Help Sofia practice essay structure",
+                description="Go over thesis statements and supporting arguments for her persuasive essay revision.",
+                due_date=t + timedelta(days=3), priority="high", category="Schoolwork",
+            ),
+            Task(
+                creator=p3_user, assignee=p3_user,
+                title="Schedule parent-teacher conference",
+                description="Reach out to Mrs. Chen about Ethan's math progress and test preparation.",
+                due_date=t + timedelta(days=10), priority="medium", category="Communication",
+            ),
+            Task(
+                creator=p3_user, assignee=p3_user,
+                title="Print math practice problems",
+                description="Download and print the extra practice problems Mrs. Chen posted.",
+                due_date=t + timedelta(days=1), priority="high", category="Schoolwork",
+            ),
+        ]
+        db.add_all(tasks)
+
+        # One flush for every ORM row above: relationships let the unit of work
+        # order the INSERTs and fill in FKs, and the generated IDs are needed by
+        # the Core inserts below.
         db.flush()
 
+        # ── Parent-Student links ──────────────────────────────
+        db.execute(parent_students.insert(), [
+            dict(parent_id=parent_id, student_id=student_id, relationship_type=rel)
+            for parent_id, student_id, rel in [
+                (p1_user.id, s1.id, RelationshipType.MOTHER),
+                (p2_user.id, s2.id, RelationshipType.FATHER),
+                (p3_user.id, s3.id, RelationshipType.MOTHER),
+            ]
+        ])
+
+        # ── Student-Teacher links ─────────────────────────────
+        for sid, tuser, tname, temail, added_by in [
+            (s1.id, t1_user.id, "Sarah Chen", "sarah.chen@classbridge.local", p1_user.id),
+            (s1.id, t2_user.id, "James Wilson", "james.wilson@classbridge.local", p1_user.id),
+            (s2.id, t1_user.id, "Sarah Chen", "sarah.chen@classbridge.local", p2_user.id),
+            (s2.id, t2_user.id, "James Wilson", "james.wilson@classbridge.local", p2_user.id),
+            (s3.id, t1_user.id, "Sarah Chen", "sarah.chen@classbridge.local", p3_user.id),
+        ]:
+            db.execute(student_teachers.insert().values(
+                student_id=sid, teacher_user_id=tuser,
+                teacher_name=tname, teacher_email=temail,
+                added_by_user_id=added_by,
+            ))
+
+        # ── Enroll students in courses ────────────────────────
+        for course in [c_sci, c_math, c_eng, c_ss]:
+            for student in [s1, s2]:
+                db.execute(student_courses.insert().values(
+                    student_id=student.id, course_id=course.id,
+                ))
+        for course in [c_sci, c_math, c_eng]:
+            db.execute(student_courses.insert().values(
+                student_id=s3.id, course_id=course.id,
+            ))
+
+        # ── Messages ──────────────────────────────────────────
         msgs = [
-            Message(
+            dict(
                 conversation_id=conv1.id, sender_id=t1_user.id,
                 content="Hi Priya, just wanted to let you know Aiden did great on his cell lab report -- 92/100! He clearly put a lot of effort into the diagrams.",
                 is_read=True, created_at=t - timedelta(days=2, hours=3),
             ),
-            Message(
+            dict(
                 conversation_id=conv1.id, sender_id=p1_user.id,
                 content="That's wonderful to hear, Mrs. Chen! He was really excited about using the microscope. Any areas he should focus on for the upcoming quiz?",
                 is_read=True, created_at=t - timedelta(days=2, hours=1),
             ),
-            Message(
+            dict(
                 conversation_id=conv1.id, sender_id=t1_user.id,
                 content="He should review the light reactions section -- that's where most students struggle. Chapter 4 in the textbook has a good summary.",
                 is_read=True, created_at=t - timedelta(days=1, hours=22),
             ),
-            Message(
+            dict(
                 conversation_id=conv1.id, sender_id=p1_user.id,
                 content="Thanks for the tip! We'll go over that this weekend.",
                 is_read=False, created_at=t - timedelta(hours=5),
             ),
-            Message(
+            dict(
                 conversation_id=conv2.id, sender_id=t2_user.id,
                 content="Hi Mr. Torres, Sofia submitted her book report on time but I noticed she could strengthen her thesis statement. I'd like to give her a chance to revise.",
                 is_read=True, created_at=t - timedelta(days=1, hours=8),
             ),
-            Message(
+            dict(
                 conversation_id=conv2.id, sender_id=p2_user.id,
                 content="Thank you for letting me know. She mentioned she rushed the conclusion. When is the revision due?",
                 is_read=True, created_at=t - timedelta(days=1, hours=4),
             ),
-            Message(
+            dict(
                 conversation_id=conv2.id, sender_id=t2_user.id,
                 content="She has until Friday to resubmit. I'd suggest she outline her main argument first, then build the thesis around it.",
                 is_read=False, created_at=t - timedelta(hours=12),
             ),
-            Message(
+            dict(
                 conversation_id=conv3.id, sender_id=p3_user.id,
                 content="Hi Mrs. Chen, Ethan is worried about the slope and intercept test next week. Is there any extra practice material available?",
                 is_read=True, created_at=t - timedelta(days=1, hours=6),
             ),
-            Message(
+            dict(
                 conversation_id=conv3.id, sender_id=t1_user.id,
                 content="Hi Jennifer, I've posted some practice problems on the course page. Ethan can also come to tutoring on Wednesday after school.",
                 is_read=True, created_at=t - timedelta(days=1, hours=2),
             ),
-            Message(
+            dict(
                 conversation_id=conv3.id, sender_id=p3_user.id,
                 content="That's great -- I'll make sure he attends. He scored 32/40 on the worksheet, so he has a solid foundation to build on.",
                 is_read=False, created_at=t - timedelta(hours=8),
             ),
         ]
-        db.add_all(msgs)
+        # Core insert: message/notification IDs are never read back, so skip
+        # the ORM unit-of-work and issue one executemany per table.
+        db.execute(Message.__table__.insert(), msgs)
 
         # ── Notifications ─────────────────────────────────────
         notifications = [
-            Notification(
+            dict(
                 user_id=p1_user.id, type=NotificationType.ASSIGNMENT_DUE,
                 title="Photosynthesis Quiz due soon",
                 content="Aiden's Photosynthesis Quiz in Science 8 is due in 2 days.",
                 link="/dashboard", read=False,
             ),
-            Notification(
+            dict(
                 user_id=p1_user.id, type=NotificationType.GRADE_POSTED,
                 title="Grade posted: Cell Structure Lab Report",
                 content="Aiden received 92/100 on Cell Structure Lab Report.",
                 link="/dashboard", read=True,
             ),
-            Notification(
+            dict(
                 user_id=p2_user.id, type=NotificationType.ASSIGNMENT_DUE,
                 title="Persuasive Essay Draft due in 5 days",
                 content="Sofia's Persuasive Essay Draft in English Language Arts 8 is due soon.",
                 link="/dashboard", read=False,
             ),
-            Notification(
+            dict(
                 user_id=p2_user.id, type=NotificationType.MESSAGE,
                 title="New message from James Wilson",
                 content="Regarding: Sofia's English paper",
                 link="/messages", read=False,
             ),
-            Notification(
+            dict(
                 user_id=p3_user.id, type=NotificationType.ASSIGNMENT_DUE,
                 title="Slope and Intercept Test in 3 days",
                 content="Ethan's Slope and Intercept Test in Mathematics 8 is coming up.",
                 link="/dashboard", read=False,
             ),
-            Notification(
+            dict(
                 user_id=p3_user.id, type=NotificationType.GRADE_POSTED,
                 title="Grade posted: Linear Equations Worksheet",
                 content="Ethan received 32/40 on Linear Equations Worksheet.",
                 link="/dashboard", read=True,
             ),
-            Notification(
+            dict(
                 user_id=p1_user.id, type=NotificationType.SYSTEM,
                 title="Welcome to ClassBridge!",
                 content="Your account is set up. Explore the dashboard to see your child's courses and assignments.",
                 link="/dashboard", read=True,
             ),
-            Notification(
+            dict(
                 user_id=p2_user.id, type=NotificationType.SYSTEM,
                 title="Welcome to ClassBridge!",
                 content="Your account is set up. Explore the dashboard to see your child's courses and assignments.",
                 link="/dashboard", read=True,
             ),
-            Notification(
+            dict(
                 user_id=p3_user.id, type=NotificationType.SYSTEM,
                 title="Welcome to ClassBridge!",
                 content="Your account is set up. Explore the dashboard to see your child's courses and assignments.",
                 link="/dashboard", read=True,
             ),
         ]
-        db.add_all(notifications)
-
-        # ── Tasks ─────────────────────────────────────────────
-        tasks = [
-            Task(
-                created_by_user_id=p1_user.id, assigned_to_user_id=p1_user.id,
-                title="Review Aiden's science project outline",
-                description="Help Aiden choose a biome for his ecosystem diorama and gather materials.",
-                due_date=t + timedelta(days=5), priority="medium", category="Schoolwork",
-            ),
-            Task(
-                created_by_user_id=p1_user.id, assigned_to_user_id=p1_user.id,
-                title="Buy poster board for diorama",
-                description="Pick up supplies from the craft store for the ecosystem project.",
-                due_date=t + timedelta(days=7), priority="low", category="Shopping",
-            ),
-            Task(
-                created_by_user_id=p2_user.id, assigned_to_user_id=p2_user.id,
-                title="Help Sofia practice essay structure",
-                description="Go over thesis statements and supporting arguments for her persuasive essay revision.",
-                due_date=t + timedelta(days=3), priority="high", category="Schoolwork",
-            ),
-            Task(
-                created_by_user_id=p3_user.id, assigned_to_user_id=p3_user.id,
-                title="Schedule parent-teacher conference",
-                description="Reach out to Mrs. Chen about Ethan's math progress and test preparation.",
-                due_date=t + timedelta(days=10), priority="medium", category="Communication",
-            ),
-            Task(
-                created_by_user_id=p3_user.id, assigned_to_user_id=p3_user.id,
-                title="Print math practice problems",
-                description="Download and print the extra practice problems Mrs. Chen posted.",
-                due_date=t + timedelta(days=1), priority="high", category="Schoolwork",
-            ),
-        ]
-        db.add_all(tasks)
+        db.execute(Notification.__table__.insert(), notifications)
 
         db.commit()
 
@@ -18,8 +18,11 @@ Usage:
     # Custom target
     python scripts/smoke-test.py --base-url http://localhost:8000 --email a@b.com --password pw
 
+Requires urllib3 (listed in requirements.txt) for its pooled HTTP client;
+everything else is stdlib.
+
 Environment variables (alternative to CLI args):
-    SMOKE_BASE_URL, SMOKE_EMAIL, SMOKE_PASSWORD, SENDGRID_API_KEY
+    SMOKE_BASE_URL, SMOKE_EMAIL, SMOKE_PASSWORD, SENDGRID_API_KEY, SMOKE_QUIET
 
 Credentials file format (scripts/smoke-credentials.json):
     {
@@ -31,14 +34,18 @@ Credentials file format (scripts/smoke-credentials.json):
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import Request, urlopen
-from urllib.parse import urlencode
 from urllib.error import HTTPError, URLError
 
+import urllib3
+
 # --- Formatting helpers ---
 
 GREEN = "\033[92m"
@@ -60,19 +67,22 @@ class TestTracker:
         self.results = []  # (status, name, detail, elapsed_ms, section)
         self._current_section = ""
         self._slow_threshold_ms = 5000
+        self.quiet = False  # suppress per-test PASS lines (failures still print)
 
     def set_section(self, name):
         self._current_section = name
 
     def ok(self, name, detail="", elapsed_ms=0):
         self.passed += 1
+        self.results.append(("PASS", name, detail, elapsed_ms, self._current_section))
+        if self.quiet:
+            return
         timing = f" {DIM}{elapsed_ms}ms{RESET}" if elapsed_ms else ""
         slow = f" {YELLOW}SLOW{RESET}" if elapsed_ms > self._slow_threshold_ms else ""
         msg = f"  {GREEN}PASS{RESET}  {name}{timing}{slow}"
         if detail:
             msg += f"  ({detail})"
         print(msg)
-        self.results.append(("PASS", name, detail, elapsed_ms, self._current_section))
 
     def fail(self, name, detail="", elapsed_ms=0):
         self.failed += 1
@@ -130,71 +140,75 @@ def _timed_request(func, *args, **kwargs):
     return code, body, elapsed_ms
 
 
-def api_get(base, path, token=None, timeout=30):
-    """GET request, returns (status_code, json_body | None)."""
-    url = f"{base}{path}"
-    headers = {}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    req = Request(url, headers=headers, method="GET")
+# Probes within a section are independent GETs, so they are issued
+# concurrently; results are reported in the original order afterwards.
+MAX_PARALLEL_PROBES = 8
+
+# One shared pool for the whole run: every request to the target host reuses
+# a kept-alive TCP/TLS connection instead of paying a fresh handshake.
+# Failed requests are never retried, but redirects are followed, as urlopen
+# did, so an endpoint behind a 3xx reports its final status. ``total`` is
+# left unset because it would cap redirects too.
+http = urllib3.PoolManager(
+    num_pools=2,
+    maxsize=MAX_PARALLEL_PROBES,
+    retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=3),
+)
+
+
+def _timed_get_many(base, paths, token=None):
+    """Run GETs concurrently and return {path: (status, body, elapsed_ms)}."""
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_PROBES, len(paths))) as pool:
+        futures = {
+            path: pool.submit(_timed_request, api_get, base, path, token)
+            for path in paths
+        }
+        return {path: future.result() for path, future in futures.items()}
+
+
+def _send(method, url, timeout, **kwargs):
+    """Issue a request on the shared pool, returns (status_code, json_body | None)."""
     try:
-        with urlopen(req, timeout=timeout) as resp:
-            raw = resp.read().decode()
-            try:
-                body = json.loads(raw)
-            except (json.JSONDecodeError, ValueError):
-                body = None
-            return resp.status, body
-    except HTTPError as e:
-        try:
-            body = json.loads(e.read().decode())
-        except Exception:
-            body = None
-        return e.code, body
-    except (URLError, TimeoutError) as e:
+        resp = http.request(
+            method, url, timeout=timeout, preload_content=False, **kwargs,
+        )
+    except urllib3.exceptions.HTTPError as e:
         return 0, {"error": str(e)}
+    # Parse straight off the response stream rather than buffering resp.data
+    # and decoding it into a second copy first.
+    try:
+        body = json.load(resp)
+    except (json.JSONDecodeError, ValueError):
+        body = None
+    except urllib3.exceptions.HTTPError as e:
+        return 0, {"error": str(e)}
+    finally:
+        resp.release_conn()
+    return resp.status, body
+
+
+@functools.lru_cache(maxsize=8)
+def _get_headers(token):
+    """GET headers, built once per token and shared read-only by every probe."""
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def api_get(base, path, token=None, timeout=30):
+    """GET request, returns (status_code, json_body | None)."""
+    return _send("GET", f"{base}{path}", timeout, headers=_get_headers(token))
 
 
 def api_post_form(base, path, data, timeout=30):
     """POST form-encoded data, returns (status_code, json_body | None)."""
-    url = f"{base}{path}"
-    encoded = urlencode(data).encode()
-    req = Request(url, data=encoded, method="POST")
-    req.add_header("Content-Type", "application/x-www-form-urlencoded")
-    try:
-        with urlopen(req, timeout=timeout) as resp:
-            body = json.loads(resp.read().decode())
-            return resp.status, body
-    except HTTPError as e:
-        try:
-            body = json.loads(e.read().decode())
-        except Exception:
-            body = None
-        return e.code, body
-    except (URLError, TimeoutError) as e:
-        return 0, {"error": str(e)}
+    return _send("POST", f"{base}{path}", timeout, fields=data, encode_multipart=False)
 
 
 def api_post_json(base, path, data, token=None, timeout=30):
     """POST JSON data, returns (status_code, json_body | None)."""
-    url = f"{base}{path}"
-    encoded = json.dumps(data).encode()
     headers = {"Content-Type": "application/json"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    req = Request(url, data=encoded, headers=headers, method="POST")
-    try:
-        with urlopen(req, timeout=timeout) as resp:
-            body = json.loads(resp.read().decode())
-            return resp.status, body
-    except HTTPError as e:
-        try:
-            body = json.loads(e.read().decode())
-        except Exception:
-            body = None
-        return e.code, body
-    except (URLError, TimeoutError) as e:
-        return 0, {"error": str(e)}
+    return _send("POST", f"{base}{path}", timeout, body=json.dumps(data).encode(), headers=headers)
 
 
 # --- Test groups ---
@@ -221,8 +235,10 @@ def test_unauthenticated_protection(base):
     tracker.set_section("Auth Protection")
     print(f"\n{BOLD}Auth Protection (no token -> 401){RESET}")
 
-    for path in ["/api/users/me", "/api/courses/", "/api/tasks/", "/api/admin/stats"]:
-        code, _, ms = _timed_request(api_get, base, path)
+    paths = ["/api/users/me", "/api/courses/", "/api/tasks/", "/api/admin/stats"]
+    results = _timed_get_many(base, paths)
+    for path in paths:
+        code, _, ms = results[path]
         if code == 401:
             tracker.ok(f"GET {path} -> 401", elapsed_ms=ms)
         else:
@@ -274,15 +290,18 @@ def test_common_endpoints(base, token, role_label=""):
         # /api/search removed — chatbot unified search (#1698)
     ]
 
+    results = _timed_get_many(
+        base, [path for path, *_ in endpoints] + ["/api/inspiration/random"], token,
+    )
     for path, _type, check, detail_fn in endpoints:
-        code, body, ms = _timed_request(api_get, base, path, token)
+        code, body, ms = results[path]
         if code == 200 and body is not None and check(body):
             tracker.ok(f"GET {path}", detail_fn(body), ms)
         else:
             tracker.fail(f"GET {path}", f"code={code}", ms)
 
     # Inspiration — 404 is acceptable (no messages seeded)
-    code, body, ms = _timed_request(api_get, base, "/api/inspiration/random", token)
+    code, body, ms = results["/api/inspiration/random"]
     if code == 200 and body and "text" in body:
         tracker.ok("GET /api/inspiration/random", f"'{body['text'][:40]}...'", ms)
     elif code == 404:
@@ -295,52 +314,63 @@ def test_parent_endpoints(base, token):
     tracker.set_section("Parent Endpoints")
     print(f"\n{BOLD}Parent Endpoints{RESET}")
 
-    code, body, ms = _timed_request(api_get, base, "/api/parent/children", token)
+    results = _timed_get_many(base, [
+        "/api/parent/children",
+        "/api/parent/dashboard",
+        "/api/study/guides",
+        "/api/study/upload/formats",
+        "/api/messages/conversations",
+        "/api/messages/unread-count",
+        "/api/messages/recipients",
+        "/api/notifications/settings",
+    ], token)
+
+    code, body, ms = results["/api/parent/children"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/parent/children", f"{len(body)} children", ms)
     else:
         tracker.fail("GET /api/parent/children", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/parent/dashboard", token)
+    code, body, ms = results["/api/parent/dashboard"]
     if code == 200 and isinstance(body, dict):
         tracker.ok("GET /api/parent/dashboard", elapsed_ms=ms)
     else:
         tracker.fail("GET /api/parent/dashboard", f"code={code}", ms)
 
     # Study guides
-    code, body, ms = _timed_request(api_get, base, "/api/study/guides", token)
+    code, body, ms = results["/api/study/guides"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/study/guides", f"{len(body)} guides", ms)
     else:
         tracker.fail("GET /api/study/guides", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/study/upload/formats", token)
+    code, body, ms = results["/api/study/upload/formats"]
     if code == 200 and isinstance(body, dict):
         tracker.ok("GET /api/study/upload/formats", elapsed_ms=ms)
     else:
         tracker.fail("GET /api/study/upload/formats", f"code={code}", ms)
 
     # Messages
-    code, body, ms = _timed_request(api_get, base, "/api/messages/conversations", token)
+    code, body, ms = results["/api/messages/conversations"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/messages/conversations", f"{len(body)} conversations", ms)
     else:
         tracker.fail("GET /api/messages/conversations", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/messages/unread-count", token)
+    code, body, ms = results["/api/messages/unread-count"]
     if code == 200 and isinstance(body, dict):
         tracker.ok("GET /api/messages/unread-count", f"count={body.get('count', '?')}", ms)
     else:
         tracker.fail("GET /api/messages/unread-count", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/messages/recipients", token)
+    code, body, ms = results["/api/messages/recipients"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/messages/recipients", f"{len(body)} recipients", ms)
     else:
         tracker.fail("GET /api/messages/recipients", f"code={code}", ms)
 
     # Notification settings
-    code, body, ms = _timed_request(api_get, base, "/api/notifications/settings", token)
+    code, body, ms = results["/api/notifications/settings"]
     if code == 200 and isinstance(body, dict):
         tracker.ok("GET /api/notifications/settings", elapsed_ms=ms)
     else:
@@ -351,25 +381,32 @@ def test_teacher_endpoints(base, token):
     tracker.set_section("Teacher Endpoints")
     print(f"\n{BOLD}Teacher Endpoints{RESET}")
 
-    code, body, ms = _timed_request(api_get, base, "/api/courses/teaching", token)
+    results = _timed_get_many(base, [
+        "/api/courses/teaching",
+        "/api/students/",
+        "/api/messages/conversations",
+        "/api/messages/recipients",
+    ], token)
+
+    code, body, ms = results["/api/courses/teaching"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/courses/teaching", f"{len(body)} courses", ms)
     else:
         tracker.fail("GET /api/courses/teaching", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/students/", token)
+    code, body, ms = results["/api/students/"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/students/", f"{len(body)} students", ms)
     else:
         tracker.fail("GET /api/students/", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/messages/conversations", token)
+    code, body, ms = results["/api/messages/conversations"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/messages/conversations", f"{len(body)} conversations", ms)
     else:
         tracker.fail("GET /api/messages/conversations", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/messages/recipients", token)
+    code, body, ms = results["/api/messages/recipients"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/messages/recipients", f"{len(body)} recipients", ms)
     else:
@@ -380,19 +417,25 @@ def test_student_endpoints(base, token):
     tracker.set_section("Student Endpoints")
     print(f"\n{BOLD}Student Endpoints{RESET}")
 
-    code, body, ms = _timed_request(api_get, base, "/api/courses/enrolled/me", token)
+    results = _timed_get_many(base, [
+        "/api/courses/enrolled/me",
+        "/api/assignments/",
+        "/api/study/guides",
+    ], token)
+
+    code, body, ms = results["/api/courses/enrolled/me"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/courses/enrolled/me", f"{len(body)} courses", ms)
     else:
         tracker.fail("GET /api/courses/enrolled/me", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/assignments/", token)
+    code, body, ms = results["/api/assignments/"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/assignments/", f"{len(body)} assignments", ms)
     else:
         tracker.fail("GET /api/assignments/", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/study/guides", token)
+    code, body, ms = results["/api/study/guides"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/study/guides", f"{len(body)} guides", ms)
     else:
@@ -403,26 +446,33 @@ def test_admin_endpoints(base, token):
     tracker.set_section("Admin Endpoints")
     print(f"\n{BOLD}Admin Endpoints{RESET}")
 
-    code, body, ms = _timed_request(api_get, base, "/api/admin/stats", token)
+    results = _timed_get_many(base, [
+        "/api/admin/stats",
+        "/api/admin/users?limit=5",
+        "/api/admin/audit-logs?limit=5",
+        "/api/inspiration/messages",
+    ], token)
+
+    code, body, ms = results["/api/admin/stats"]
     if code == 200 and isinstance(body, dict):
         users = body.get("total_users", "?")
         tracker.ok("GET /api/admin/stats", f"total_users={users}", ms)
     else:
         tracker.fail("GET /api/admin/stats", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/admin/users?limit=5", token)
+    code, body, ms = results["/api/admin/users?limit=5"]
     if code == 200 and isinstance(body, dict) and "users" in body:
         tracker.ok("GET /api/admin/users", f"{len(body['users'])} returned", ms)
     else:
         tracker.fail("GET /api/admin/users", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/admin/audit-logs?limit=5", token)
+    code, body, ms = results["/api/admin/audit-logs?limit=5"]
     if code == 200 and isinstance(body, dict) and "items" in body:
         tracker.ok("GET /api/admin/audit-logs", f"{len(body['items'])} entries", ms)
     else:
         tracker.fail("GET /api/admin/audit-logs", f"code={code}", ms)
 
-    code, body, ms = _timed_request(api_get, base, "/api/inspiration/messages", token)
+    code, body, ms = results["/api/inspiration/messages"]
     if code == 200 and isinstance(body, list):
         tracker.ok("GET /api/inspiration/messages", f"{len(body)} messages", ms)
     else:
@@ -468,7 +518,7 @@ def test_sendgrid(sendgrid_key):
         start = time.monotonic()
         with urlopen(req, timeout=15) as resp:
             ms = int((time.monotonic() - start) * 1000)
-            body = json.loads(resp.read().decode())
+            body = json.load(resp)
             senders = body.get("results", [])
             verified = [s for s in senders if s.get("verified", False)]
             tracker.ok(
@@ -497,7 +547,7 @@ def test_sendgrid(sendgrid_key):
         start = time.monotonic()
         with urlopen(req, timeout=15) as resp:
             ms = int((time.monotonic() - start) * 1000)
-            domains = json.loads(resp.read().decode())
+            domains = json.load(resp)
             if isinstance(domains, list) and len(domains) > 0:
                 valid = [d for d in domains if d.get("valid")]
                 tracker.ok(
@@ -637,9 +687,16 @@ Examples:
         default=os.environ.get("SMOKE_JSON_OUTPUT"),
         help="Path to write JSON results report (e.g. smoke-results.json)",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        default=bool(os.environ.get("SMOKE_QUIET")),
+        help="Only print failures, skips and the summary",
+    )
     args = parser.parse_args()
 
     base = args.base_url.rstrip("/")
+    tracker.quiet = args.quiet
     start_time = time.monotonic()
 
     print(f"{BOLD}{CYAN}=== ClassBridge Production Smoke Test ==={RESET}")
@@ -654,6 +711,13 @@ Examples:
     else:
         print(f"warning: health returned {code}")
 
+    # /health never touches the DB, so the first authenticated call would
+    # otherwise pay for pool/ORM init. Prime it on a public DB-backed route in
+    # the background while the health and auth-protection checks run.
+    threading.Thread(
+        target=api_get, args=(base, "/api/v1/public/waitlist-stats"), daemon=True,
+    ).start()
+
     # Always run health + auth protection tests
     test_health(base)
     test_unauthenticated_protection(base)
@@ -1,42 +1,93 @@
-import importlib
 import os
-import sys
+import tempfile
 
 import pytest
 from fastapi.testclient import TestClient
 
+# Point the app at a throwaway SQLite file *before* anything under ``app`` is
+# imported, so config, engine and models are built once against the test DB
+# instead of being re-imported by the ``app`` fixture. Each xdist worker
+# imports this conftest separately and therefore gets its own directory; the
+# worker id in the file name (test_emai_gw0.db, ...) ties a leftover DB to the
+# worker that wrote it. Run as ``pytest -n auto --dist loadfile`` (CI does) so
+# a file's session-scoped seed users never race another worker's.
+#
+# Where available the directory lives on tmpfs (/dev/shm), so the DB is RAM
+# backed without giving up a real file: an in-memory ``StaticPool`` engine
+# would funnel every session -- handlers, jobs and the test's own -- through
+# one connection and one transaction, and their commits/rollbacks would bleed
+# into each other.
+_worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+_test_db_dir = tempfile.TemporaryDirectory(
+    prefix=f"emai-test-db-{_worker_id}-",
+    dir="/dev/shm" if os.path.isdir("/dev/shm") else None,
+)
+os.environ["DATABASE_URL"] = (
+    f"sqlite:///{os.path.join(_test_db_dir.name, f'test_emai_{_worker_id}.db')}"
+)
+os.environ["TESTING"] = "1"
+os.environ.setdefault("GOOGLE_CLASSROOM_ENABLED", "true")
+os.environ.setdefault("WAITLIST_ENABLED", "false")
+# bcrypt's minimum cost: tests compare hashes via login, never their strength,
+# so production's 12 rounds (~250 ms per hash) would be pure fixture overhead.
+os.environ["BCRYPT_ROUNDS"] = "4"
+
 # Ensure all SQLAlchemy models are loaded before any test runs (#2686)
-import app.models  # noqa: F401
+import app.models  # noqa: F401, E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import configure_mappers  # noqa: E402
+
+from app.db.database import engine as _test_engine  # noqa: E402
+
+# Resolve every relationship up front, once per worker, so the first query of
+# whichever test happens to run first doesn't pay for it (or surface a broken
+# mapper as that test's failure).
+configure_mappers()
+
+
+# The test DB is disposable, so trade durability for write throughput: no
+# fsync per commit, WAL instead of a rollback journal, temp tables in RAM.
+# Registered before ``main`` is imported so every pooled connection gets it.
+@event.listens_for(_test_engine, "connect")
+def _set_fast_sqlite_pragmas(dbapi_conn, connection_record):
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+
+# FAST_HASH=1 swaps bcrypt for a salt-free SHA-256 inside ``app.core.security``
+# (hashing and verification both go through it, so seeded users and logins
+# stay consistent). Patching the module's ``bcrypt`` reference rather than
+# ``get_password_hash`` itself also covers routes that imported the helpers
+# by name. Off by default so the normal run still exercises real bcrypt.
+if os.environ.get("FAST_HASH"):
+    import hashlib
+    import types
+
+    from app.core import security as _security
+
+    def _fast_hashpw(password: bytes, salt: bytes) -> bytes:
+        return b"test$" + hashlib.sha256(password).hexdigest().encode()
+
+    _security.bcrypt = types.SimpleNamespace(
+        gensalt=lambda rounds=12: b"",
+        hashpw=_fast_hashpw,
+        checkpw=lambda password, hashed: _fast_hashpw(password, b"") == hashed,
+    )
 
 
 @pytest.fixture(scope="session")
-def test_db_url(tmp_path_factory):
-    db_path = tmp_path_factory.mktemp("db") / "test_emai.db"
-    return f"sqlite:///{db_path}"
+def test_db_url():
+    return os.environ["DATABASE_URL"]
 
 
 @pytest.fixture(scope="session")
 def app(test_db_url):
-    os.environ["DATABASE_URL"] = test_db_url
-    os.environ["TESTING"] = "1"
-    os.environ.setdefault("GOOGLE_CLASSROOM_ENABLED", "true")
-    os.environ.setdefault("WAITLIST_ENABLED", "false")
-
-    import app.core.config as config
-    importlib.reload(config)
-
-    for module_name in list(sys.modules):
-        if module_name.startswith("app.models"):
-            del sys.modules[module_name]
-
     import app.db.database as database
-    importlib.reload(database)
-
-    import app.models
-    importlib.reload(app.models)
-
     import main as main_module
-    importlib.reload(main_module)
 
     app_instance = main_module.app
     app_instance.router.on_startup.clear()
@@ -60,8 +111,54 @@ def db_session(app):
 
 
 @pytest.fixture()
+def rollback_session(app):
+    """DB session whose writes, commits included, are rolled back after the test.
+
+    The session joins an outer transaction on a dedicated connection and turns
+    its own commits into SAVEPOINT releases, so nothing reaches the database
+    file. Only for tests that stay on this session: HTTP handlers and services
+    open their own connections and will not see these rows.
+    """
+    from app.db.database import SessionLocal, engine
+
+    connection = engine.connect()
+    trans = connection.begin()
+    # pysqlite defers BEGIN until the first DML, so a leading SAVEPOINT would
+    # open (and its RELEASE commit) a real transaction; begin one explicitly.
+    connection.exec_driver_sql("BEGIN")
+    db = SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield db
+    finally:
+        db.close()
+        trans.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def seed_session(app):
+    """Session-scoped DB session for fixtures that seed shared rows once per run.
+
+    Seeded rows are committed (HTTP handlers and services read them through
+    their own connections), and ``expire_on_commit=False`` keeps the returned
+    objects' attributes loaded for every test that uses them.
+    """
+    from app.db.database import SessionLocal
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# One TestClient for the whole run: the app keeps no per-client state (no
+# cookies, no dependency overrides) and startup hooks are cleared above, so
+# re-entering its lifespan for every test buys nothing. Redirects are not
+# followed, so a non-canonical URL (e.g. a missing trailing slash) shows up as
+# a 307 instead of silently costing a second request.
+@pytest.fixture(scope="session")
 def client(app):
-    with TestClient(app) as test_client:
+    with TestClient(app, follow_redirects=False) as test_client:
         yield test_client
 
 
@@ -157,14 +254,44 @@ def _isolate_task_sync_flag(app):
 PASSWORD = "Password123!"
 
 
+def _register(client, email, role="parent", full_name="Test User"):
+    return client.post("/api/auth/register", json={
+        "email": email, "password": PASSWORD, "full_name": full_name, "role": role,
+    })
+
+
 def _login(client, email):
     resp = client.post("/api/auth/login", data={"username": email, "password": PASSWORD})
     assert resp.status_code == 200, resp.text
     return resp.json()["access_token"]
 
 
+# Access tokens memoised per (client, email) for ``_auth``. Each real login
+# runs a bcrypt verify; the token stays valid for the rest of the run unless a
+# test revokes it (logout, account deletion), and such tests -- like the ones
+# asserting on login itself -- call ``_login`` directly.
+_access_tokens: dict[tuple[int, str], str] = {}
+# The header dict for each of those tokens, shared between callers: copy it
+# (``{**_auth(...), ...}``) rather than mutate it to add a header.
+_auth_headers: dict[str, dict[str, str]] = {}
+
+
 def _auth(client, email):
-    return {"Authorization": f"Bearer {_login(client, email)}"}
+    key = (id(client), email)
+    token = _access_tokens.get(key)
+    if token is None:
+        token = _access_tokens[key] = _login(client, email)
+    headers = _auth_headers.get(token)
+    if headers is None:
+        headers = _auth_headers[token] = {"Authorization": f"Bearer {token}"}
+    return headers
+
+
+@pytest.fixture(scope="session")
+def hashed_password():
+    """bcrypt hash of ``PASSWORD``, computed once per run for seeded users."""
+    from app.core.security import get_password_hash
+    return get_password_hash(PASSWORD)
 
 
 # ── CB-DCI-001 shared seed factory (#4275) ──
@@ -60,8 +60,10 @@ def family(db_session):
     db_session.commit()
 
     # Link both children to parent
-    db_session.execute(parent_students.insert().values(parent_id=parent.id, student_id=student.id))
-    db_session.execute(parent_students.insert().values(parent_id=parent.id, student_id=student2.id))
+    db_session.execute(parent_students.insert(), [
+        {"parent_id": parent.id, "student_id": student.id},
+        {"parent_id": parent.id, "student_id": student2.id},
+    ])
     db_session.commit()
 
     teacher = Teacher(user_id=teacher_user.id)
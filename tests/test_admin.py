@@ -1,55 +1,27 @@
 import pytest
-from conftest import PASSWORD, _login, _auth
-
-
-@pytest.fixture()
-def users(db_session):
-    from app.core.security import get_password_hash
-    from app.models.user import User, UserRole
-
-    admin_email = "adm_admin@test.com"
-    admin = db_session.query(User).filter(User.email == admin_email).first()
-    if admin:
-        parent = db_session.query(User).filter(User.email == "adm_parent@test.com").first()
-        student = db_session.query(User).filter(User.email == "adm_student@test.com").first()
-        return {"admin": admin, "parent": parent, "student": student}
-
-    hashed = get_password_hash(PASSWORD)
-    admin = User(email=admin_email, full_name="Admin Boss", role=UserRole.ADMIN, hashed_password=hashed)
-    parent = User(email="adm_parent@test.com", full_name="Admin Parent", role=UserRole.PARENT, hashed_password=hashed)
-    student = User(email="adm_student@test.com", full_name="Admin Student", role=UserRole.STUDENT, hashed_password=hashed)
-    db_session.add_all([admin, parent, student])
-    db_session.commit()
-    for u in [admin, parent, student]:
-        db_session.refresh(u)
-    return {"admin": admin, "parent": parent, "student": student}
+from conftest import _auth
 
+from app.models.user import User, UserRole
 
-# ── Original test ─────────────────────────────────────────────
 
-def test_admin_stats_requires_admin(client, db_session):
-    from app.core.security import get_password_hash
-    from app.models.user import User, UserRole
+@pytest.fixture(scope="session")
+def users(seed_session, hashed_password):
+    """Seed the three admin-test users once; every test in the module shares them."""
+    admin = User(email="adm_admin@test.com", full_name="Admin Boss", role=UserRole.ADMIN, hashed_password=hashed_password)
+    parent = User(email="adm_parent@test.com", full_name="Admin Parent", role=UserRole.PARENT, hashed_password=hashed_password)
+    student = User(email="adm_student@test.com", full_name="Admin Student", role=UserRole.STUDENT, hashed_password=hashed_password)
+    seed_session.add_all([admin, parent, student])
+    seed_session.commit()
+    return {"admin": admin, "parent": parent, "student": student}
 
-    admin = db_session.query(User).filter(User.email == "admin@example.com").first()
-    if not admin:
-        admin = User(
-            email="admin@example.com", full_name="Admin User",
-            role=UserRole.ADMIN, hashed_password=get_password_hash(PASSWORD),
-        )
-        user = User(
-            email="regular@example.com", full_name="Regular User",
-            role=UserRole.PARENT, hashed_password=get_password_hash(PASSWORD),
-        )
-        db_session.add_all([admin, user])
-        db_session.commit()
 
-    user_token = _login(client, "regular@example.com")
-    user_resp = client.get("/api/admin/stats", headers={"Authorization": f"Bearer {user_token}"})
+# ── Original test ─────────────────────────────────────────────
+
+def test_admin_stats_requires_admin(client, users):
+    user_resp = client.get("/api/admin/stats", headers=_auth(client, users["parent"].email))
     assert user_resp.status_code == 403
 
-    admin_token = _login(client, "admin@example.com")
-    admin_resp = client.get("/api/admin/stats", headers={"Authorization": f"Bearer {admin_token}"})
+    admin_resp = client.get("/api/admin/stats", headers=_auth(client, users["admin"].email))
     assert admin_resp.status_code == 200
 
 
@@ -61,8 +33,7 @@ class TestAdminUsers:
         resp = client.get("/api/admin/users", headers=headers)
         assert resp.status_code == 200
         data = resp.json()
-        assert "users" in data
-        assert "total" in data
+        assert data["users"]
         assert data["total"] >= 3  # at least admin, parent, student
 
     def test_filter_by_role(self, client, users):
@@ -70,35 +41,40 @@ class TestAdminUsers:
         resp = client.get("/api/admin/users?role=parent", headers=headers)
         assert resp.status_code == 200
         data = resp.json()
-        for u in data["users"]:
-            assert u["role"] == "parent"
+        assert data["users"]
+        assert {u["role"] for u in data["users"]} == {"parent"}
 
     def test_search_by_name(self, client, users):
         headers = _auth(client, users["admin"].email)
         resp = client.get("/api/admin/users?search=Admin+Boss", headers=headers)
         assert resp.status_code == 200
-        data = resp.json()
-        assert any(u["email"] == users["admin"].email for u in data["users"])
+        emails = [u["email"] for u in resp.json()["users"]]
+        assert users["admin"].email in emails
 
     def test_pagination(self, client, users):
         headers = _auth(client, users["admin"].email)
         resp = client.get("/api/admin/users?skip=0&limit=1", headers=headers)
         assert resp.status_code == 200
         data = resp.json()
-        assert len(data["users"]) <= 1
+        assert len(data["users"]) == 1
         assert data["total"] >= 3  # total is full count
 
+    def test_count_only(self, client, users):
+        """limit=0 returns the total without serializing any rows."""
+        headers = _auth(client, users["admin"].email)
+        resp = client.get("/api/admin/users?limit=0", headers=headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["users"] == []
+        assert data["total"] >= 3
+
 
 # ── Admin permissions ─────────────────────────────────────────
 
 class TestAdminPermissions:
-    def test_parent_cannot_access_admin_users(self, client, users):
-        headers = _auth(client, users["parent"].email)
-        resp = client.get("/api/admin/users", headers=headers)
-        assert resp.status_code == 403
-
-    def test_student_cannot_access_admin_users(self, client, users):
-        headers = _auth(client, users["student"].email)
+    @pytest.mark.parametrize("role", ["parent", "student"])
+    def test_non_admin_cannot_access_admin_users(self, client, users, role):
+        headers = _auth(client, users[role].email)
         resp = client.get("/api/admin/users", headers=headers)
         assert resp.status_code == 403
 
@@ -121,10 +97,8 @@ class TestAdminRoleManagement:
 
     def test_remove_teacher_role_from_multi_role_user(self, client, users, db_session):
         headers = _auth(client, users["admin"].email)
-        parent = users["parent"]
         # Ensure parent has teacher role (may have been added in previous test)
-        from app.models.user import UserRole
-        db_session.refresh(parent)
+        parent = db_session.get(User, users["parent"].id)
         if not parent.has_role(UserRole.TEACHER):
             client.post(
                 f"/api/admin/users/{parent.id}/add-role",
@@ -1,39 +1,21 @@
 import pytest
-from conftest import PASSWORD, _login, _auth
+from conftest import _auth
 
 
-@pytest.fixture()
-def users(db_session):
-    from app.core.security import get_password_hash
+@pytest.fixture(scope="session")
+def users(seed_session, hashed_password):
     from app.models.user import User, UserRole
     from app.models.teacher import Teacher
     from app.models.course import Course
 
-    parent = db_session.query(User).filter(User.email == "asgn_parent@test.com").first()
-    if parent:
-        teacher = db_session.query(User).filter(User.email == "asgn_teacher@test.com").first()
-        teacher_rec = db_session.query(Teacher).filter(Teacher.user_id == teacher.id).first()
-        course = db_session.query(Course).filter(Course.name == "Asgn Test Course").first()
-        return {"parent": parent, "teacher": teacher, "teacher_rec": teacher_rec, "course": course}
-
-    hashed = get_password_hash(PASSWORD)
-    parent = User(email="asgn_parent@test.com", full_name="Asgn Parent", role=UserRole.PARENT, hashed_password=hashed)
-    teacher = User(email="asgn_teacher@test.com", full_name="Asgn Teacher", role=UserRole.TEACHER, hashed_password=hashed)
-    db_session.add_all([parent, teacher])
-    db_session.flush()
-
-    teacher_rec = Teacher(user_id=teacher.id)
-    db_session.add(teacher_rec)
-    db_session.flush()
-
-    course = Course(name="Asgn Test Course", teacher_id=teacher_rec.id, created_by_user_id=teacher.id)
-    db_session.add(course)
-    db_session.commit()
-
-    for u in [parent, teacher]:
-        db_session.refresh(u)
-    db_session.refresh(teacher_rec)
-    db_session.refresh(course)
+    parent = User(email="asgn_parent@test.com", full_name="Asgn Parent", role=UserRole.PARENT, hashed_password=hashed_password)
+    teacher = User(email="asgn_teacher@test.com", full_name="Asgn Teacher", role=UserRole.TEACHER, hashed_password=hashed_password)
+    # Linked through relationships so the unit of work orders the inserts
+    # and fills in the foreign keys within a single flush.
+    teacher_rec = Teacher(user=teacher)
+    course = Course(name="Asgn Test Course", teacher=teacher_rec, created_by=teacher)
+    seed_session.add_all([parent, teacher, teacher_rec, course])
+    seed_session.commit()
     return {"parent": parent, "teacher": teacher, "teacher_rec": teacher_rec, "course": course}
 
 
@@ -1,31 +1,22 @@
 """Tests for audit logging feature."""
 import pytest
-from conftest import PASSWORD, _login, _auth
+from conftest import _register, _login, _auth
 
 
-def _register(client, email, role="parent", full_name="Test User"):
-    return client.post("/api/auth/register", json={
-        "email": email, "password": PASSWORD, "full_name": full_name, "role": role,
-    })
-
-
-def _setup_admin(client, db_session):
-    """Create an admin user directly in DB (admin self-registration is blocked)."""
-    from app.core.security import get_password_hash
+@pytest.fixture(scope="session")
+def admin_email(seed_session, hashed_password):
+    """Seed the audit-log admin once (admin self-registration is blocked)."""
     from app.models.user import User, UserRole
 
-    email = f"admin-audit-{id(client)}@test.com"
-    existing = db_session.query(User).filter(User.email == email).first()
-    if not existing:
-        admin = User(
-            email=email,
-            full_name="Admin Audit",
-            role=UserRole.ADMIN,
-            hashed_password=get_password_hash(PASSWORD),
-        )
-        db_session.add(admin)
-        db_session.commit()
-    return _auth(client, email)
+    admin = User(
+        email="admin-audit@test.com",
+        full_name="Admin Audit",
+        role=UserRole.ADMIN,
+        hashed_password=hashed_password,
+    )
+    seed_session.add(admin)
+    seed_session.commit()
+    return admin.email
 
 
 class TestAuditOnLogin:
@@ -70,8 +61,8 @@ class TestAuditOnLogin:
 
 
 class TestAdminAuditEndpoint:
-    def test_admin_can_list_audit_logs(self, client, db_session):
-        headers = _setup_admin(client, db_session)
+    def test_admin_can_list_audit_logs(self, client, admin_email):
+        headers = _auth(client, admin_email)
         resp = client.get("/api/admin/audit-logs", headers=headers)
         assert resp.status_code == 200
         data = resp.json()
@@ -87,31 +78,31 @@ class TestAdminAuditEndpoint:
         resp = client.get("/api/admin/audit-logs", headers=headers)
         assert resp.status_code == 403
 
-    def test_filter_by_action(self, client, db_session):
-        headers = _setup_admin(client, db_session)
+    def test_filter_by_action(self, client, admin_email):
+        headers = _auth(client, admin_email)
         resp = client.get("/api/admin/audit-logs", headers=headers, params={"action": "login"})
         assert resp.status_code == 200
         data = resp.json()
         for item in data["items"]:
             assert item["action"] == "login"
 
-    def test_filter_by_resource_type(self, client, db_session):
-        headers = _setup_admin(client, db_session)
+    def test_filter_by_resource_type(self, client, admin_email):
+        headers = _auth(client, admin_email)
         resp = client.get("/api/admin/audit-logs", headers=headers, params={"resource_type": "user"})
         assert resp.status_code == 200
         data = resp.json()
         for item in data["items"]:
             assert item["resource_type"] == "user"
 
-    def test_pagination(self, client, db_session):
-        headers = _setup_admin(client, db_session)
+    def test_pagination(self, client, admin_email):
+        headers = _auth(client, admin_email)
         resp = client.get("/api/admin/audit-logs", headers=headers, params={"limit": 2, "skip": 0})
         assert resp.status_code == 200
         data = resp.json()
         assert len(data["items"]) <= 2
 
-    def test_audit_entry_has_user_name(self, client, db_session):
-        headers = _setup_admin(client, db_session)
+    def test_audit_entry_has_user_name(self, client, admin_email):
+        headers = _auth(client, admin_email)
         resp = client.get("/api/admin/audit-logs", headers=headers, params={"action": "login"})
         assert resp.status_code == 200
         data = resp.json()
@@ -3,13 +3,21 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 from jose import jwt
-from conftest import PASSWORD, _login, _auth
+from sqlalchemy import func, select, update
+from conftest import PASSWORD, _register, _login, _auth
 
+from app.core.config import settings
 
-def _register(client, email, role="parent", full_name="Test User"):
-    return client.post("/api/auth/register", json={
-        "email": email, "password": PASSWORD, "full_name": full_name, "role": role,
-    })
+
+def _signed(claims):
+    return jwt.encode(claims, settings.secret_key, algorithm=settings.algorithm)
+
+
+# Hand-signed tokens with constant claims: ``exp=0`` (the epoch) is expired
+# whenever the test runs, and 2100-01-01 is comfortably in the future.
+EXPIRED_TOKEN = _signed({"sub": "999", "exp": 0})
+NONEXISTENT_USER_TOKEN = _signed({"sub": "999999", "exp": 4102444800})
+EXPIRED_RESET_TOKEN = _signed({"sub": "auth_reset@test.com", "exp": 0, "type": "password_reset"})
 
 
 # ── Original tests ────────────────────────────────────────────
@@ -38,15 +46,14 @@ def test_register_login_me(client):
     assert body["role"] == payload["role"]
 
 
-def test_login_rejects_invalid_password(client, db_session):
-    from app.core.security import get_password_hash
+def test_login_rejects_invalid_password(client, db_session, hashed_password):
     from app.models.user import User, UserRole
 
     user = User(
         email="loginfail@example.com",
         full_name="Login Fail",
         role=UserRole.PARENT,
-        hashed_password=get_password_hash("Password123!"),
+        hashed_password=hashed_password,
     )
     db_session.add(user)
     db_session.commit()
@@ -72,41 +79,36 @@ class TestRegistration:
 
     def test_register_teacher_creates_teacher_record(self, client, db_session):
         from app.models.teacher import Teacher
-        from app.models.user import User
 
         email = "auth_teacher@test.com"
         resp = _register(client, email, role="teacher", full_name="Auth Teacher")
         assert resp.status_code == 200
         user_id = resp.json()["id"]
 
-        teacher = db_session.query(Teacher).filter(Teacher.user_id == user_id).first()
-        assert teacher is not None
+        teacher_id = db_session.execute(
+            select(Teacher.id).where(Teacher.user_id == user_id)
+        ).scalar_one_or_none()
+        assert teacher_id is not None
 
     def test_register_student_creates_student_record(self, client, db_session):
         from app.models.student import Student
-        from app.models.user import User
 
         email = "auth_student@test.com"
         resp = _register(client, email, role="student", full_name="Auth Student")
         assert resp.status_code == 200
         user_id = resp.json()["id"]
 
-        student = db_session.query(Student).filter(Student.user_id == user_id).first()
-        assert student is not None
+        student_id = db_session.execute(
+            select(Student.id).where(Student.user_id == user_id)
+        ).scalar_one_or_none()
+        assert student_id is not None
 
 
 # ── Token validation tests ────────────────────────────────────
 
 class TestTokenValidation:
     def test_expired_token_rejected(self, client):
-        from app.core.config import settings
-
-        expired_token = jwt.encode(
-            {"sub": "999", "exp": datetime.now(timezone.utc) - timedelta(minutes=5)},
-            settings.secret_key,
-            algorithm=settings.algorithm,
-        )
-        resp = client.get("/api/users/me", headers={"Authorization": f"Bearer {expired_token}"})
+        resp = client.get("/api/users/me", headers={"Authorization": f"Bearer {EXPIRED_TOKEN}"})
         assert resp.status_code == 401
 
     def test_invalid_token_rejected(self, client):
@@ -114,38 +116,28 @@ class TestTokenValidation:
         assert resp.status_code == 401
 
     def test_token_for_nonexistent_user(self, client):
-        from app.core.config import settings
-
-        token = jwt.encode(
-            {"sub": "999999", "exp": datetime.now(timezone.utc) + timedelta(minutes=30)},
-            settings.secret_key,
-            algorithm=settings.algorithm,
-        )
-        resp = client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"})
+        resp = client.get("/api/users/me", headers={"Authorization": f"Bearer {NONEXISTENT_USER_TOKEN}"})
         assert resp.status_code == 401
 
 
 # ── Accept-invite tests ──────────────────────────────────────
 
-class TestAcceptInvite:
-    @pytest.fixture()
-    def parent_user(self, db_session):
-        from app.core.security import get_password_hash
-        from app.models.user import User, UserRole
+@pytest.fixture(scope="session")
+def parent_user(seed_session):
+    from app.core.security import UNUSABLE_PASSWORD_HASH
+    from app.models.user import User, UserRole
 
-        email = "auth_inviter@test.com"
-        user = db_session.query(User).filter(User.email == email).first()
-        if user:
-            return user
-        user = User(
-            email=email, full_name="Auth Inviter", role=UserRole.PARENT,
-            hashed_password=get_password_hash(PASSWORD),
-        )
-        db_session.add(user)
-        db_session.commit()
-        db_session.refresh(user)
-        return user
+    # Only ever referenced as the inviter, never logged in as.
+    user = User(
+        email="auth_inviter@test.com", full_name="Auth Inviter", role=UserRole.PARENT,
+        hashed_password=UNUSABLE_PASSWORD_HASH,
+    )
+    seed_session.add(user)
+    seed_session.commit()
+    return user
 
+
+class TestAcceptInvite:
     def test_accept_student_invite(self, client, db_session, parent_user):
         from app.models.invite import Invite, InviteType
         from app.models.student import Student, parent_students
@@ -170,23 +162,25 @@ class TestAcceptInvite:
         data = resp.json()
         assert "access_token" in data
 
-        # Verify student record was created
-        from app.models.user import User
-        new_user = db_session.query(User).filter(User.email == "auth_invited_student@test.com").first()
-        assert new_user is not None
-        assert new_user.role.value == "student"
-
-        student = db_session.query(Student).filter(Student.user_id == new_user.id).first()
-        assert student is not None
+        # Verify the student user and its Student record were created
+        from app.models.user import User, UserRole
+        row = db_session.execute(
+            select(User.role, Student.id)
+            .join(Student, Student.user_id == User.id)
+            .where(User.email == "auth_invited_student@test.com")
+        ).first()
+        assert row is not None
+        role, student_id = row
+        assert role == UserRole.STUDENT
 
         # Verify parent-student link
-        link = db_session.execute(
-            parent_students.select().where(
+        links = db_session.scalar(
+            select(func.count()).select_from(parent_students).where(
                 parent_students.c.parent_id == parent_user.id,
-                parent_students.c.student_id == student.id,
+                parent_students.c.student_id == student_id,
             )
-        ).first()
-        assert link is not None
+        )
+        assert links == 1
 
     def test_expired_invite_rejected(self, client, db_session, parent_user):
         from app.models.invite import Invite, InviteType
@@ -244,24 +238,34 @@ class TestAcceptInvite:
 
 # ── Password reset tests ──────────────────────────────────────
 
+@pytest.fixture(scope="session")
+def reset_user(seed_session, hashed_password):
+    from app.models.user import User, UserRole
+
+    user = User(
+        email="auth_reset@test.com", full_name="Reset User", role=UserRole.PARENT,
+        hashed_password=hashed_password,
+    )
+    seed_session.add(user)
+    seed_session.commit()
+    return user
+
+
 class TestPasswordReset:
     @pytest.fixture()
-    def reset_user(self, db_session):
-        from app.core.security import get_password_hash
-        from app.models.user import User, UserRole
+    def restore_reset_password(self, seed_session, hashed_password, reset_user):
+        """Put the seeded hash back after a test that changes the password.
 
-        email = "auth_reset@test.com"
-        user = db_session.query(User).filter(User.email == email).first()
-        if user:
-            return user
-        user = User(
-            email=email, full_name="Reset User", role=UserRole.PARENT,
-            hashed_password=get_password_hash(PASSWORD),
+        Written as an UPDATE: ``reset_user`` still holds the seeded value in
+        memory, so reassigning the attribute would not be flushed.
+        """
+        yield
+        from app.models.user import User
+
+        seed_session.execute(
+            update(User).where(User.id == reset_user.id).values(hashed_password=hashed_password)
         )
-        db_session.add(user)
-        db_session.commit()
-        db_session.refresh(user)
-        return user
+        seed_session.commit()
 
     def test_forgot_password_valid_email(self, client, reset_user):
         """Should return 200 and generic message for valid email."""
@@ -275,7 +279,7 @@ class TestPasswordReset:
         assert resp.status_code == 200
         assert "reset link" in resp.json()["message"].lower()
 
-    def test_reset_password_valid_token(self, client, reset_user):
+    def test_reset_password_valid_token(self, client, reset_user, restore_reset_password):
         """Should successfully reset the password with a valid token."""
         from app.core.security import create_password_reset_token
 
@@ -303,14 +307,8 @@ class TestPasswordReset:
 
     def test_reset_password_expired_token(self, client, reset_user):
         """Should reject an expired token."""
-        from app.core.config import settings
-
-        expired_token = jwt.encode(
-            {"sub": reset_user.email, "exp": datetime.now(timezone.utc) - timedelta(hours=1), "type": "password_reset"},
-            settings.secret_key, algorithm=settings.algorithm,
-        )
         resp = client.post("/api/auth/reset-password", json={
-            "token": expired_token, "new_password": "NewPassword456!",
+            "token": EXPIRED_RESET_TOKEN, "new_password": "NewPassword456!",
         })
         assert resp.status_code == 400
 
@@ -1,199 +1,219 @@
 """Tests for CASCADE delete rules and unique constraints (#145, #146, #187)."""
 import pytest
-from sqlalchemy import insert
+from sqlalchemy import event, insert, inspect
 from sqlalchemy.exc import IntegrityError
 
+from app.core.security import UNUSABLE_PASSWORD_HASH
+from app.models.assignment import Assignment
+from app.models.course import Course
+from app.models.course_content import CourseContent
+from app.models.message import Conversation, Message
+from app.models.notification import Notification, NotificationType
+from app.models.student import parent_students, RelationshipType, Student
+from app.models.task import Task
+from app.models.user import User, UserRole
 
-def _make_user(db, email, role_name, full_name=None):
-    from app.core.security import get_password_hash
-    from app.models.user import User, UserRole
 
+def _make_user(db, email, role_name, full_name=None):
+    # Cascade fixtures never log in, so skip hashing a real password.
     role = UserRole(role_name)
     user = User(
         email=email,
         full_name=full_name or email.split("@")[0],
         role=role,
-        hashed_password=get_password_hash("Password123!"),
+        hashed_password=UNUSABLE_PASSWORD_HASH,
     )
     db.add(user)
-    db.flush()
     return user
 
 
 # ── CASCADE DELETE tests ─────────────────────────────────────
+#
+# Supporting rows are linked through relationships so one flush writes them,
+# but the child under test is attached by its bare FK id: putting it in the
+# parent's loaded collection would make the ORM null the FK on delete instead
+# of leaving the work to the database's ON DELETE CASCADE.
+#
+# The database deletes those children behind the session's back, so each
+# check expires the identity map first; otherwise ``get()`` would hand back
+# the stale in-memory child without querying.
 
 
 class TestCascadeDeleteUser:
-    def test_deleting_user_cascades_student(self, db_session):
-        """Deleting a user should cascade-delete their Student record."""
-        from app.models.user import User
-        from app.models.student import Student
-
-        user = _make_user(db_session, "cas_stu@test.com", "student")
-        student = Student(user_id=user.id)
-        db_session.add(student)
-        db_session.flush()
-        student_id = student.id
-
-        db_session.delete(user)
-        db_session.commit()
-
-        assert db_session.query(Student).filter(Student.id == student_id).first() is None
-
-    def test_deleting_user_cascades_notifications(self, db_session):
-        """Deleting a user should cascade-delete their notifications."""
-        from app.models.user import User
-        from app.models.notification import Notification, NotificationType
-
-        user = _make_user(db_session, "cas_notif@test.com", "parent")
+    def test_deleting_user_cascades_all_children(self, rollback_session):
+        """Deleting a user should cascade-delete their Student record,
+        notifications and the tasks they created, in one delete."""
+        user = _make_user(rollback_session, "cas_user@test.com", "parent")
+        student = Student(user=user)
         notif = Notification(
-            user_id=user.id, type=NotificationType.SYSTEM,
+            user=user, type=NotificationType.SYSTEM,
             title="Test", content="test",
         )
-        db_session.add(notif)
-        db_session.flush()
-        notif_id = notif.id
-
-        db_session.delete(user)
-        db_session.commit()
-
-        assert db_session.query(Notification).filter(Notification.id == notif_id).first() is None
-
-    def test_deleting_user_cascades_created_tasks(self, db_session):
-        """Deleting a user should cascade-delete tasks they created."""
-        from app.models.user import User
-        from app.models.task import Task
-
-        user = _make_user(db_session, "cas_task@test.com", "parent")
-        task = Task(
-            title="Test Task", created_by_user_id=user.id,
-        )
-        db_session.add(task)
-        db_session.flush()
-        task_id = task.id
+        rollback_session.add_all([student, notif])
+        rollback_session.flush()
+        task = Task(title="Test Task", created_by_user_id=user.id)
+        rollback_session.add(task)
+        rollback_session.flush()
+        ids = {Student: student.id, Notification: notif.id, Task: task.id}
 
-        db_session.delete(user)
-        db_session.commit()
+        rollback_session.delete(user)
+        rollback_session.flush()
 
-        assert db_session.query(Task).filter(Task.id == task_id).first() is None
+        rollback_session.expire_all()
+        for model, row_id in ids.items():
+            assert rollback_session.get(model, row_id) is None, model.__name__
 
 
 class TestCascadeDeleteCourse:
-    def test_deleting_course_cascades_assignments(self, db_session):
+    def test_deleting_course_cascades_assignments(self, rollback_session):
         """Deleting a course should cascade-delete its assignments."""
-        from app.models.course import Course
-        from app.models.assignment import Assignment
-
-        creator = _make_user(db_session, "cas_course_creator@test.com", "teacher")
-        course = Course(name="Cascade Test Course", created_by_user_id=creator.id)
-        db_session.add(course)
-        db_session.flush()
+        creator = _make_user(rollback_session, "cas_course_creator@test.com", "teacher")
+        course = Course(name="Cascade Test Course", created_by=creator)
+        rollback_session.add(course)
+        rollback_session.flush()
 
         assignment = Assignment(title="Test Assignment", course_id=course.id)
-        db_session.add(assignment)
-        db_session.flush()
+        rollback_session.add(assignment)
+        rollback_session.flush()
         assignment_id = assignment.id
 
-        db_session.delete(course)
-        db_session.commit()
+        rollback_session.delete(course)
+        rollback_session.flush()
 
-        assert db_session.query(Assignment).filter(Assignment.id == assignment_id).first() is None
+        rollback_session.expire_all()
+        assert rollback_session.get(Assignment, assignment_id) is None
 
-    def test_deleting_course_cascades_course_contents(self, db_session):
+    def test_deleting_course_cascades_course_contents(self, rollback_session):
         """Deleting a course should cascade-delete its contents."""
-        from app.models.course import Course
-        from app.models.course_content import CourseContent
-
-        creator = _make_user(db_session, "cas_cc_creator@test.com", "teacher")
-        course = Course(name="CC Cascade Course", created_by_user_id=creator.id)
-        db_session.add(course)
-        db_session.flush()
+        creator = _make_user(rollback_session, "cas_cc_creator@test.com", "teacher")
+        course = Course(name="CC Cascade Course", created_by=creator)
+        rollback_session.add(course)
+        rollback_session.flush()
 
         content = CourseContent(
             title="Test Content", course_id=course.id,
-            content_type="notes", created_by_user_id=creator.id,
+            content_type="notes", created_by=creator,
         )
-        db_session.add(content)
-        db_session.flush()
+        rollback_session.add(content)
+        rollback_session.flush()
         content_id = content.id
 
-        db_session.delete(course)
-        db_session.commit()
+        rollback_session.delete(course)
+        rollback_session.flush()
 
-        assert db_session.query(CourseContent).filter(CourseContent.id == content_id).first() is None
+        rollback_session.expire_all()
+        assert rollback_session.get(CourseContent, content_id) is None
 
 
 class TestCascadeDeleteConversation:
-    def test_deleting_conversation_cascades_messages(self, db_session):
+    def test_deleting_conversation_cascades_messages(self, rollback_session):
         """Deleting a conversation should cascade-delete its messages."""
-        from app.models.message import Conversation, Message
+        user1 = _make_user(rollback_session, "cas_conv1@test.com", "parent")
+        user2 = _make_user(rollback_session, "cas_conv2@test.com", "teacher")
+        conv = Conversation(participant_1=user1, participant_2=user2)
+        rollback_session.add(conv)
+        rollback_session.flush()
+
+        msg = Message(conversation_id=conv.id, sender=user1, content="Hello")
+        rollback_session.add(msg)
+        rollback_session.flush()
+        msg_id = msg.id
 
-        user1 = _make_user(db_session, "cas_conv1@test.com", "parent")
-        user2 = _make_user(db_session, "cas_conv2@test.com", "teacher")
-        conv = Conversation(
-            participant_1_id=user1.id, participant_2_id=user2.id,
-        )
-        db_session.add(conv)
-        db_session.flush()
+        rollback_session.delete(conv)
+        rollback_session.flush()
+
+        rollback_session.expire_all()
+        assert rollback_session.get(Message, msg_id) is None
 
-        msg = Message(
-            conversation_id=conv.id, sender_id=user1.id, content="Hello",
+
+def _count_deletes(session):
+    """Start counting DELETE statements on *session*'s connection; returns the live list."""
+    deletes = []
+
+    @event.listens_for(session.connection(), "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("DELETE"):
+            deletes.append(statement)
+
+    return deletes
+
+
+class TestPassiveDeletes:
+    """passive_deletes relationships must leave child rows to ON DELETE CASCADE.
+
+    Without it SQLAlchemy loads the children and deletes them row by row, so
+    a parent with N children costs N+1 DELETEs instead of one.
+    """
+
+    def test_deleting_course_emits_single_delete(self, rollback_session):
+        creator = _make_user(rollback_session, "cas_passive_course@test.com", "teacher")
+        course = Course(name="Passive Delete Course", created_by=creator)
+        rollback_session.add(course)
+        rollback_session.flush()
+        rollback_session.add_all(
+            [Assignment(title=f"A{i}", course_id=course.id) for i in range(3)]
+            + [CourseContent(title=f"C{i}", course_id=course.id, content_type="notes") for i in range(3)]
         )
-        db_session.add(msg)
-        db_session.flush()
-        msg_id = msg.id
+        rollback_session.flush()
+
+        deletes = _count_deletes(rollback_session)
+        rollback_session.delete(course)
+        rollback_session.flush()
+
+        assert len(deletes) == 1, deletes
+
+    def test_deleting_conversation_emits_single_delete(self, rollback_session):
+        user1 = _make_user(rollback_session, "cas_passive_conv1@test.com", "parent")
+        user2 = _make_user(rollback_session, "cas_passive_conv2@test.com", "teacher")
+        conv = Conversation(participant_1=user1, participant_2=user2)
+        rollback_session.add(conv)
+        rollback_session.flush()
+        rollback_session.add_all(
+            [Message(conversation_id=conv.id, sender=user1, content=f"M{i}") for i in range(3)]
+        )
+        rollback_session.flush()
 
-        db_session.delete(conv)
-        db_session.commit()
+        deletes = _count_deletes(rollback_session)
+        rollback_session.delete(conv)
+        rollback_session.flush()
 
-        assert db_session.query(Message).filter(Message.id == msg_id).first() is None
+        assert len(deletes) == 1, deletes
 
 
 # ── SET NULL tests ───────────────────────────────────────────
 
 
 class TestSetNull:
-    def test_deleting_user_sets_null_on_course_creator(self, db_session):
+    def test_deleting_user_sets_null_on_course_creator(self, rollback_session):
         """Deleting a user should SET NULL on courses.created_by_user_id."""
-        from app.models.user import User
-        from app.models.course import Course
-
-        creator = _make_user(db_session, "cas_setnull_creator@test.com", "parent")
-        course = Course(name="SetNull Test Course", created_by_user_id=creator.id)
-        db_session.add(course)
-        db_session.commit()
+        creator = _make_user(rollback_session, "cas_setnull_creator@test.com", "parent")
+        course = Course(name="SetNull Test Course", created_by=creator)
+        rollback_session.add(course)
+        rollback_session.flush()
         course_id = course.id
 
-        db_session.delete(creator)
-        db_session.commit()
+        rollback_session.delete(creator)
+        rollback_session.flush()
 
-        db_session.expire_all()
-        course = db_session.query(Course).filter(Course.id == course_id).first()
+        rollback_session.expire_all()
+        course = rollback_session.get(Course, course_id)
         assert course is not None
         assert course.created_by_user_id is None
 
-    def test_deleting_course_sets_null_on_task(self, db_session):
+    def test_deleting_course_sets_null_on_task(self, rollback_session):
         """Deleting a course should SET NULL on tasks.course_id."""
-        from app.models.course import Course
-        from app.models.task import Task
-
-        creator = _make_user(db_session, "cas_task_setnull@test.com", "parent")
-        course = Course(name="Task SetNull Course", created_by_user_id=creator.id)
-        db_session.add(course)
-        db_session.flush()
-
-        task = Task(
-            title="Linked Task", created_by_user_id=creator.id, course_id=course.id,
-        )
-        db_session.add(task)
-        db_session.commit()
+        creator = _make_user(rollback_session, "cas_task_setnull@test.com", "parent")
+        course = Course(name="Task SetNull Course", created_by=creator)
+        task = Task(title="Linked Task", creator=creator, course=course)
+        rollback_session.add_all([course, task])
+        rollback_session.flush()
         task_id = task.id
 
-        db_session.delete(course)
-        db_session.commit()
+        rollback_session.delete(course)
+        rollback_session.flush()
 
-        db_session.expire_all()
-        task = db_session.query(Task).filter(Task.id == task_id).first()
+        rollback_session.expire_all()
+        task = rollback_session.get(Task, task_id)
         assert task is not None
         assert task.course_id is None
 
@@ -202,50 +222,28 @@ class TestSetNull:
 
 
 class TestUniqueConstraints:
-    def test_duplicate_parent_student_rejected(self, db_session):
+    def test_duplicate_parent_student_rejected(self, rollback_session):
         """Inserting duplicate parent_students pair should raise IntegrityError."""
-        from app.models.student import Student, parent_students, RelationshipType
-
-        parent = _make_user(db_session, "cas_uq_parent@test.com", "parent")
-        student_user = _make_user(db_session, "cas_uq_student@test.com", "student")
-        student = Student(user_id=student_user.id)
-        db_session.add(student)
-        db_session.flush()
-
-        db_session.execute(insert(parent_students).values(
-            parent_id=parent.id, student_id=student.id,
-            relationship_type=RelationshipType.GUARDIAN,
-        ))
-        db_session.flush()
-
-        with pytest.raises(IntegrityError):
-            db_session.execute(insert(parent_students).values(
-                parent_id=parent.id, student_id=student.id,
-                relationship_type=RelationshipType.MOTHER,
-            ))
-            db_session.flush()
-        db_session.rollback()
-
-    def test_duplicate_student_teacher_rejected(self, db_session):
-        """Inserting duplicate student_teachers pair should raise IntegrityError."""
-        from app.models.student import Student, student_teachers
-
-        parent = _make_user(db_session, "cas_uq_parent2@test.com", "parent")
-        student_user = _make_user(db_session, "cas_uq_student2@test.com", "student")
-        student = Student(user_id=student_user.id)
-        db_session.add(student)
-        db_session.flush()
-
-        db_session.execute(insert(student_teachers).values(
-            student_id=student.id, teacher_email="cas_teacher@test.com",
-            teacher_name="Test", added_by_user_id=parent.id,
-        ))
-        db_session.flush()
-
+        parent = _make_user(rollback_session, "cas_uq_parent@test.com", "parent")
+        student_user = _make_user(rollback_session, "cas_uq_student@test.com", "student")
+        student = Student(user=student_user)
+        rollback_session.add(student)
+        rollback_session.flush()
+
+        # One executemany batch: the first row inserts, the second must trip
+        # the (parent_id, student_id) constraint despite its different type.
         with pytest.raises(IntegrityError):
-            db_session.execute(insert(student_teachers).values(
-                student_id=student.id, teacher_email="cas_teacher@test.com",
-                teacher_name="Duplicate", added_by_user_id=parent.id,
-            ))
-            db_session.flush()
-        db_session.rollback()
+            rollback_session.execute(insert(parent_students), [
+                {"parent_id": parent.id, "student_id": student.id, "relationship_type": rt}
+                for rt in (RelationshipType.GUARDIAN, RelationshipType.MOTHER)
+            ])
+        rollback_session.rollback()
+
+    @pytest.mark.parametrize("table,columns", [
+        ("parent_students", {"parent_id", "student_id"}),
+        ("student_teachers", {"student_id", "teacher_email"}),
+    ])
+    def test_pair_unique_constraint_exists(self, rollback_session, table, columns):
+        """The link tables declare their pair uniqueness in the schema itself."""
+        uniques = inspect(rollback_session.get_bind()).get_unique_constraints(table)
+        assert any(set(uq["column_names"]) == columns for uq in uniques), uniques
@@ -1,69 +1,59 @@
 import pytest
-from conftest import PASSWORD, _login, _auth
-
-
-@pytest.fixture()
-def users(db_session):
-    from app.core.security import get_password_hash
-    from app.models.user import User, UserRole
-    from app.models.teacher import Teacher
-    from app.models.course import Course
-
-    parent = db_session.query(User).filter(User.email == "cc_parent@test.com").first()
-    if parent:
-        teacher = db_session.query(User).filter(User.email == "cc_teacher@test.com").first()
-        other = db_session.query(User).filter(User.email == "cc_other@test.com").first()
-        course = db_session.query(Course).filter(Course.name == "CC Test Course").first()
-        return {"parent": parent, "teacher": teacher, "other": other, "course": course}
-
-    hashed = get_password_hash(PASSWORD)
-    parent = User(email="cc_parent@test.com", full_name="CC Parent", role=UserRole.PARENT, hashed_password=hashed)
-    teacher = User(email="cc_teacher@test.com", full_name="CC Teacher", role=UserRole.TEACHER, hashed_password=hashed)
-    other = User(email="cc_other@test.com", full_name="CC Other", role=UserRole.TEACHER, hashed_password=hashed)
-    db_session.add_all([parent, teacher, other])
-    db_session.flush()
-
-    teacher_rec = Teacher(user_id=teacher.id)
-    db_session.add(teacher_rec)
-    db_session.flush()
-
-    course = Course(name="CC Test Course", teacher_id=teacher_rec.id, created_by_user_id=teacher.id)
-    db_session.add(course)
-    db_session.commit()
-
-    for u in [parent, teacher, other]:
-        db_session.refresh(u)
-    db_session.refresh(course)
+from conftest import _auth
+
+from app.core.config import settings
+from app.models.course import Course
+from app.models.course_content import CourseContent
+from app.models.student import parent_students, Student
+from app.models.teacher import Teacher
+from app.models.user import User, UserRole
+
+
+@pytest.fixture(scope="session")
+def users(seed_session, hashed_password):
+    """Seed the course-content users and course once; every test shares them."""
+    parent = User(email="cc_parent@test.com", full_name="CC Parent", role=UserRole.PARENT, hashed_password=hashed_password)
+    teacher = User(email="cc_teacher@test.com", full_name="CC Teacher", role=UserRole.TEACHER, hashed_password=hashed_password)
+    other = User(email="cc_other@test.com", full_name="CC Other", role=UserRole.TEACHER, hashed_password=hashed_password)
+    teacher_rec = Teacher(user=teacher)
+    course = Course(name="CC Test Course", teacher=teacher_rec, created_by=teacher)
+    seed_session.add_all([parent, teacher, other, teacher_rec, course])
+    seed_session.commit()
     return {"parent": parent, "teacher": teacher, "other": other, "course": course}
 
 
 # ── CRUD ──────────────────────────────────────────────────────
 
+def _create_content(client, users, title):
+    headers = _auth(client, users["teacher"].email)
+    resp = client.post("/api/course-contents/", json={
+        "course_id": users["course"].id, "title": title,
+    }, headers=headers)
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
 class TestContentCRUD:
-    def test_create_with_defaults(self, client, users):
+    @pytest.mark.parametrize("body,expected", [
+        ({"title": "Lecture 1"}, {"title": "Lecture 1", "content_type": "other"}),
+        (
+            {"title": "Lab 1", "description": "First lab", "content_type": "labs",
+             "reference_url": "https://example.com/lab"},
+            {"description": "First lab", "content_type": "labs",
+             "reference_url": "https://example.com/lab"},
+        ),
+    ], ids=["defaults", "all_fields"])
+    def test_create(self, client, users, body, expected):
         headers = _auth(client, users["teacher"].email)
         resp = client.post("/api/course-contents/", json={
-            "course_id": users["course"].id, "title": "Lecture 1",
+            "course_id": users["course"].id, **body,
         }, headers=headers)
         assert resp.status_code == 201
         data = resp.json()
-        assert data["title"] == "Lecture 1"
-        assert data["content_type"] == "other"
+        for key, value in expected.items():
+            assert data[key] == value
         assert data["created_by_user_id"] == users["teacher"].id
 
-    def test_create_all_fields(self, client, users):
-        headers = _auth(client, users["teacher"].email)
-        resp = client.post("/api/course-contents/", json={
-            "course_id": users["course"].id, "title": "Lab 1",
-            "description": "First lab", "content_type": "labs",
-            "reference_url": "https://example.com/lab",
-        }, headers=headers)
-        assert resp.status_code == 201
-        data = resp.json()
-        assert data["description"] == "First lab"
-        assert data["content_type"] == "labs"
-        assert data["reference_url"] == "https://example.com/lab"
-
     def test_invalid_content_type_rejected(self, client, users):
         headers = _auth(client, users["teacher"].email)
         resp = client.post("/api/course-contents/", json={
@@ -79,24 +69,29 @@ class TestContentCRUD:
         }, headers=headers)
         assert resp.status_code == 404
 
-    def test_list_by_course(self, client, users):
+    def test_list_by_course(self, client, db_session, users):
         headers = _auth(client, users["teacher"].email)
-        # Create content first
-        client.post("/api/course-contents/", json={
-            "course_id": users["course"].id, "title": "List Item",
-        }, headers=headers)
+        # Seed directly; creation through the API is covered above. Committed,
+        # not just flushed, because the request reads on its own connection.
+        db_session.add(CourseContent(
+            course_id=users["course"].id, title="List Item",
+            content_type="other", created_by_user_id=users["teacher"].id,
+        ))
+        db_session.commit()
 
         resp = client.get(f"/api/course-contents/?course_id={users['course'].id}", headers=headers)
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
         assert len(resp.json()) >= 1
 
-    def test_filter_by_type(self, client, users):
+    def test_filter_by_type(self, client, db_session, users):
         headers = _auth(client, users["teacher"].email)
-        # Create with specific type
-        client.post("/api/course-contents/", json={
-            "course_id": users["course"].id, "title": "Notes Item", "content_type": "notes",
-        }, headers=headers)
+        # Seed with specific type
+        db_session.add(CourseContent(
+            course_id=users["course"].id, title="Notes Item",
+            content_type="notes", created_by_user_id=users["teacher"].id,
+        ))
+        db_session.commit()
 
         resp = client.get(
             f"/api/course-contents/?course_id={users['course'].id}&content_type=notes",
@@ -121,36 +116,31 @@ class TestContentCRUD:
 
 # ── Update ────────────────────────────────────────────────────
 
-class TestContentUpdate:
-    def _create_content(self, client, users):
-        headers = _auth(client, users["teacher"].email)
-        resp = client.post("/api/course-contents/", json={
-            "course_id": users["course"].id, "title": "Update Target",
-        }, headers=headers)
-        assert resp.status_code == 201
-        return resp.json()["id"]
+# One row for the class: each test patches a different field or is refused.
+@pytest.fixture(scope="class")
+def content_id(client, users):
+    return _create_content(client, users, "Update Target")
+
 
-    def test_creator_updates(self, client, users):
-        cid = self._create_content(client, users)
+class TestContentUpdate:
+    def test_creator_updates(self, client, users, content_id):
         headers = _auth(client, users["teacher"].email)
-        resp = client.patch(f"/api/course-contents/{cid}", json={
+        resp = client.patch(f"/api/course-contents/{content_id}", json={
             "title": "Updated Title",
         }, headers=headers)
         assert resp.status_code == 200
         assert resp.json()["title"] == "Updated Title"
 
-    def test_non_creator_cannot_update(self, client, users):
-        cid = self._create_content(client, users)
+    def test_non_creator_cannot_update(self, client, users, content_id):
         headers = _auth(client, users["other"].email)
-        resp = client.patch(f"/api/course-contents/{cid}", json={
+        resp = client.patch(f"/api/course-contents/{content_id}", json={
             "title": "Hijacked",
         }, headers=headers)
         assert resp.status_code == 403
 
-    def test_update_content_type(self, client, users):
-        cid = self._create_content(client, users)
+    def test_update_content_type(self, client, users, content_id):
         headers = _auth(client, users["teacher"].email)
-        resp = client.patch(f"/api/course-contents/{cid}", json={
+        resp = client.patch(f"/api/course-contents/{content_id}", json={
             "content_type": "syllabus",
         }, headers=headers)
         assert resp.status_code == 200
@@ -161,22 +151,14 @@ class TestContentUpdate:
 # ── Delete ────────────────────────────────────────────────────
 
 class TestContentDelete:
-    def _create_content(self, client, users):
-        headers = _auth(client, users["teacher"].email)
-        resp = client.post("/api/course-contents/", json={
-            "course_id": users["course"].id, "title": "Delete Target",
-        }, headers=headers)
-        assert resp.status_code == 201
-        return resp.json()["id"]
-
     def test_creator_deletes(self, client, users):
-        cid = self._create_content(client, users)
+        cid = _create_content(client, users, "Delete Target")
         headers = _auth(client, users["teacher"].email)
         resp = client.delete(f"/api/course-contents/{cid}", headers=headers)
         assert resp.status_code == 204
 
     def test_non_creator_cannot_delete(self, client, users):
-        cid = self._create_content(client, users)
+        cid = _create_content(client, users, "Delete Target")
         headers = _auth(client, users["other"].email)
         resp = client.delete(f"/api/course-contents/{cid}", headers=headers)
         assert resp.status_code == 403
@@ -212,8 +194,6 @@ class TestContentDownload:
     def _create_content_with_file(self, client, db_session, users):
         """Create a content item and attach a fake stored file."""
         from pathlib import Path
-        from app.models.course_content import CourseContent
-        from app.core.config import settings
 
         headers = _auth(client, users["teacher"].email)
         resp = client.post("/api/course-contents/", json={
@@ -371,55 +351,31 @@ def test_nonexistent_content_returns_404(client, users, method, url, json_body):
 
 # ── Parent access to child-created content (#896) ────────────
 
+@pytest.fixture(scope="session")
+def family(seed_session, hashed_password):
+    parent = User(email="family_parent@test.com", full_name="Family Parent", role=UserRole.PARENT, hashed_password=hashed_password)
+    child = User(email="family_child@test.com", full_name="Family Child", role=UserRole.STUDENT, hashed_password=hashed_password)
+    student = Student(user=child)
+    # Child's default course (private, not enrolled — just created)
+    child_course = Course(
+        name="Child Main Course", created_by=child,
+        is_private=True, is_default=True,
+    )
+    seed_session.add_all([parent, child, student, child_course])
+    seed_session.flush()
+
+    # Link parent to child
+    seed_session.execute(parent_students.insert().values(
+        parent_id=parent.id, student_id=student.id, relationship_type="parent",
+    ))
+    seed_session.commit()
+    return {"parent": parent, "child": child, "child_course": child_course}
+
+
 class TestParentAccessChildContent:
     """Regression test: parent must be able to access content in a course
     created by their child, even if the child is not enrolled in it."""
 
-    @pytest.fixture()
-    def family(self, db_session):
-        from app.core.security import get_password_hash
-        from app.models.user import User, UserRole
-        from app.models.student import Student, parent_students
-        from app.models.course import Course
-
-        # Re-use existing rows if already created by a prior test
-        parent = db_session.query(User).filter(User.email == "family_parent@test.com").first()
-        if parent:
-            child = db_session.query(User).filter(User.email == "family_child@test.com").first()
-            child_course = db_session.query(Course).filter(
-                Course.created_by_user_id == child.id, Course.is_default == True,
-            ).first()
-            return {"parent": parent, "child": child, "child_course": child_course}
-
-        hashed = get_password_hash(PASSWORD)
-
-        parent = User(email="family_parent@test.com", full_name="Family Parent", role=UserRole.PARENT, hashed_password=hashed)
-        child = User(email="family_child@test.com", full_name="Family Child", role=UserRole.STUDENT, hashed_password=hashed)
-        db_session.add_all([parent, child])
-        db_session.flush()
-
-        student = Student(user_id=child.id)
-        db_session.add(student)
-        db_session.flush()
-
-        # Link parent to child
-        db_session.execute(parent_students.insert().values(
-            parent_id=parent.id, student_id=student.id, relationship_type="parent",
-        ))
-
-        # Child's default course (private, not enrolled — just created)
-        child_course = Course(
-            name="Child Main Course", created_by_user_id=child.id,
-            is_private=True, is_default=True,
-        )
-        db_session.add(child_course)
-        db_session.commit()
-
-        for u in [parent, child]:
-            db_session.refresh(u)
-        db_session.refresh(child_course)
-        return {"parent": parent, "child": child, "child_course": child_course}
-
     def test_parent_can_read_child_created_content(self, client, family):
         """Parent should access content in a course their child created (#896)."""
         child_headers = _auth(client, family["child"].email)
@@ -490,16 +446,8 @@ class TestParentAccessChildContent:
 # ── Bulk Archive ─────────────────────────────────────────────
 
 class TestBulkArchive:
-    def _create_content(self, client, users, title="Bulk Item"):
-        headers = _auth(client, users["teacher"].email)
-        resp = client.post("/api/course-contents/", json={
-            "course_id": users["course"].id, "title": title,
-        }, headers=headers)
-        assert resp.status_code == 201
-        return resp.json()["id"]
-
     def test_bulk_archive_success(self, client, db_session, users):
-        ids = [self._create_content(client, users, f"Bulk {i}") for i in range(3)]
+        ids = [_create_content(client, users, f"Bulk {i}") for i in range(3)]
         headers = _auth(client, users["teacher"].email)
         resp = client.post("/api/course-contents/bulk-archive", json={
             "content_ids": ids[:2],
@@ -508,7 +456,6 @@ class TestBulkArchive:
         assert resp.json()["archived"] == 2
 
         # Verify archived_at is set on the two archived items
-        from app.models.course_content import CourseContent
         for cid in ids[:2]:
             db_session.expire_all()
             cc = db_session.query(CourseContent).filter(CourseContent.id == cid).first()
@@ -525,11 +472,10 @@ class TestBulkArchive:
         assert resp.status_code == 422
 
     def test_bulk_archive_already_archived(self, client, db_session, users):
-        cid = self._create_content(client, users, "Already Archived")
+        cid = _create_content(client, users, "Already Archived")
         headers = _auth(client, users["teacher"].email)
 
         # Archive it individually first
-        from app.models.course_content import CourseContent
         from datetime import datetime, timezone
         cc = db_session.query(CourseContent).filter(CourseContent.id == cid).first()
         cc.archived_at = datetime.now(timezone.utc)
@@ -542,7 +488,7 @@ class TestBulkArchive:
         assert resp.status_code == 404
 
     def test_bulk_archive_permission_denied(self, client, db_session, users):
-        cid = self._create_content(client, users, "No Permission")
+        cid = _create_content(client, users, "No Permission")
         # "other" teacher is not the creator and not admin
         headers = _auth(client, users["other"].email)
         resp = client.post("/api/course-contents/bulk-archive", json={
@@ -552,7 +498,6 @@ class TestBulkArchive:
         assert resp.json()["archived"] == 0
 
         # Verify item is still not archived
-        from app.models.course_content import CourseContent
         db_session.expire_all()
         cc = db_session.query(CourseContent).filter(CourseContent.id == cid).first()
         assert cc.archived_at is None
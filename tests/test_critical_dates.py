@@ -1,204 +1,173 @@
 """Tests for critical date parsing and auto-task creation from AI-generated content."""
 
 import pytest
-from datetime import datetime
-from conftest import PASSWORD, _login, _auth
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event
 
+from app.api.routes.study import auto_create_tasks_from_dates, parse_critical_dates
+from app.models.task import Task
+from app.models.user import User, UserRole
 
-class TestParseCriticalDates:
-    """Test the parse_critical_dates helper function."""
 
-    def test_no_dates_section(self):
-        from app.api.routes.study import parse_critical_dates
+def _date(date, title, priority):
+    return {"date": date, "title": title, "priority": priority}
 
-        content = "# Study Guide\n\nHere is some content about algebra."
-        clean, dates = parse_critical_dates(content)
-        assert clean == content
-        assert dates == []
 
-    def test_valid_dates_section(self):
-        from app.api.routes.study import parse_critical_dates
+def _days_ahead(days):
+    """An ISO date relative to today, so the helper never drops it as historical."""
+    return (datetime.now(timezone.utc).date() + timedelta(days=days)).isoformat()
 
-        content = (
-            "# Study Guide\n\nHere is content.\n\n"
-            "--- CRITICAL_DATES ---\n"
-            '[{"date": "2026-03-15", "title": "Biology Exam", "priority": "high"}]'
-        )
-        clean, dates = parse_critical_dates(content)
-        assert "CRITICAL_DATES" not in clean
-        assert clean.strip() == "# Study Guide\n\nHere is content."
-        assert len(dates) == 1
-        assert dates[0]["date"] == "2026-03-15"
-        assert dates[0]["title"] == "Biology Exam"
-        assert dates[0]["priority"] == "high"
 
-    def test_multiple_dates(self):
-        from app.api.routes.study import parse_critical_dates
+class TestParseCriticalDates:
+    """Test the parse_critical_dates helper function."""
 
-        content = (
+    @pytest.mark.parametrize("content,expected_clean,expected_dates", [
+        (
+            "# Study Guide\n\nHere is some content about algebra.",
+            "# Study Guide\n\nHere is some content about algebra.",
+            [],
+        ),
+        (
+            "# Study Guide\n\nHere is content.\n\n"
+            "--- CRITICAL_DATES ---\n"
+            '[{"date": "2026-03-15", "title": "Biology Exam", "priority": "high"}]',
+            "# Study Guide\n\nHere is content.",
+            [_date("2026-03-15", "Biology Exam", "high")],
+        ),
+        (
             "Some content\n\n"
             "--- CRITICAL_DATES ---\n"
             '[{"date": "2026-03-15", "title": "Exam", "priority": "high"}, '
-            '{"date": "2026-03-10", "title": "Homework", "priority": "medium"}]'
-        )
-        clean, dates = parse_critical_dates(content)
-        assert len(dates) == 2
-        assert dates[0]["title"] == "Exam"
-        assert dates[1]["title"] == "Homework"
-
-    def test_malformed_json(self):
-        from app.api.routes.study import parse_critical_dates
-
-        content = "Some content\n\n--- CRITICAL_DATES ---\nnot valid json"
-        clean, dates = parse_critical_dates(content)
-        assert clean == "Some content"
-        assert dates == []
-
-    def test_missing_required_fields(self):
-        from app.api.routes.study import parse_critical_dates
-
-        content = (
+            '{"date": "2026-03-10", "title": "Homework", "priority": "medium"}]',
+            "Some content",
+            [_date("2026-03-15", "Exam", "high"), _date("2026-03-10", "Homework", "medium")],
+        ),
+        ("Some content\n\n--- CRITICAL_DATES ---\nnot valid json", "Some content", []),
+        (
+            # Only the entry with both date and title should be included
             "Content\n\n"
             "--- CRITICAL_DATES ---\n"
             '[{"date": "2026-03-15"}, {"title": "No date"}, '
-            '{"date": "2026-04-01", "title": "Valid", "priority": "medium"}]'
-        )
-        clean, dates = parse_critical_dates(content)
-        # Only the entry with both date and title should be included
-        assert len(dates) == 1
-        assert dates[0]["title"] == "Valid"
-
-    def test_default_priority(self):
-        from app.api.routes.study import parse_critical_dates
-
-        content = (
+            '{"date": "2026-04-01", "title": "Valid", "priority": "medium"}]',
+            "Content",
+            [_date("2026-04-01", "Valid", "medium")],
+        ),
+        (
             "Content\n\n"
             "--- CRITICAL_DATES ---\n"
-            '[{"date": "2026-03-15", "title": "Task without priority"}]'
-        )
-        clean, dates = parse_critical_dates(content)
-        assert len(dates) == 1
-        assert dates[0]["priority"] == "medium"
-
-    def test_dates_with_json_fences(self):
-        from app.api.routes.study import parse_critical_dates
-
-        content = (
+            '[{"date": "2026-03-15", "title": "Task without priority"}]',
+            "Content",
+            [_date("2026-03-15", "Task without priority", "medium")],
+        ),
+        (
             "Content\n\n"
             "--- CRITICAL_DATES ---\n"
             "```json\n"
             '[{"date": "2026-03-15", "title": "Exam", "priority": "high"}]\n'
-            "```"
-        )
+            "```",
+            "Content",
+            [_date("2026-03-15", "Exam", "high")],
+        ),
+        ("Content\n\n--- CRITICAL_DATES ---\n[]", "Content", []),
+        ('Content\n\n--- CRITICAL_DATES ---\n{"date": "2026-03-15"}', "Content", []),
+    ], ids=[
+        "no_dates_section", "valid_dates_section", "multiple_dates", "malformed_json",
+        "missing_required_fields", "default_priority", "dates_with_json_fences",
+        "empty_dates_array", "not_a_list",
+    ])
+    def test_parse(self, content, expected_clean, expected_dates):
         clean, dates = parse_critical_dates(content)
-        assert len(dates) == 1
-        assert dates[0]["title"] == "Exam"
+        assert clean == expected_clean
+        assert dates == expected_dates
 
-    def test_empty_dates_array(self):
-        from app.api.routes.study import parse_critical_dates
 
-        content = "Content\n\n--- CRITICAL_DATES ---\n[]"
-        clean, dates = parse_critical_dates(content)
-        assert clean == "Content"
-        assert dates == []
-
-    def test_not_a_list(self):
-        from app.api.routes.study import parse_critical_dates
-
-        content = 'Content\n\n--- CRITICAL_DATES ---\n{"date": "2026-03-15"}'
-        clean, dates = parse_critical_dates(content)
-        assert clean == "Content"
-        assert dates == []
+@pytest.fixture(scope="session")
+def task_data(seed_session, hashed_password):
+    """Seed the task-creating parent once."""
+    parent = User(
+        email="taskdatesparent@test.com",
+        full_name="Task Dates Parent",
+        role=UserRole.PARENT,
+        hashed_password=hashed_password,
+    )
+    seed_session.add(parent)
+    seed_session.commit()
+    return {"parent": parent}
 
 
 class TestAutoCreateTasksFromDates:
-    """Test auto_create_tasks_from_dates helper."""
-
-    @pytest.fixture()
-    def task_data(self, db_session):
-        """Create test user for task creation."""
-        from app.core.security import get_password_hash
-        from app.models.user import User, UserRole
-
-        parent = db_session.query(User).filter(User.email == "taskdatesparent@test.com").first()
-        if parent:
-            return {"parent": parent}
-
-        hashed = get_password_hash(PASSWORD)
-        parent = User(
-            email="taskdatesparent@test.com",
-            full_name="Task Dates Parent",
-            role=UserRole.PARENT,
-            hashed_password=hashed,
-        )
-        db_session.add(parent)
-        db_session.commit()
-        return {"parent": parent}
+    """Test auto_create_tasks_from_dates helper.
 
-    def test_creates_tasks_from_dates(self, db_session, task_data):
-        from app.api.routes.study import auto_create_tasks_from_dates
-        from app.models.task import Task
+    The helper only flushes, and these tests read back through the same
+    session, so they run on ``rollback_session`` without committing.
+    """
 
+    def test_creates_tasks_from_dates(self, rollback_session, task_data):
         parent = task_data["parent"]
         dates = [
-            {"date": "2026-04-15", "title": "Biology Exam", "priority": "high"},
-            {"date": "2026-04-10", "title": "Homework Due", "priority": "medium"},
+            {"date": _days_ahead(30), "title": "Biology Exam", "priority": "high"},
+            {"date": _days_ahead(25), "title": "Homework Due", "priority": "medium"},
         ]
         created = auto_create_tasks_from_dates(
-            db_session, dates, parent,
+            rollback_session, dates, parent,
             study_guide_id=None, course_id=None, course_content_id=None,
         )
-        db_session.commit()
 
         assert len(created) == 2
         assert created[0]["title"] == "Biology Exam"
         assert created[0]["priority"] == "high"
         assert created[1]["title"] == "Homework Due"
 
-        # Verify tasks in DB
-        tasks = db_session.query(Task).filter(Task.created_by_user_id == parent.id).all()
-        assert len(tasks) >= 2
-
-    def test_skips_invalid_dates(self, db_session, task_data):
-        from app.api.routes.study import auto_create_tasks_from_dates
-
-        parent = task_data["parent"]
-        dates = [
-            {"date": "not-a-date", "title": "Bad Date Task", "priority": "medium"},
-            {"date": "2026-05-01", "title": "Good Date Task", "priority": "low"},
-        ]
-        created = auto_create_tasks_from_dates(
-            db_session, dates, parent,
-            study_guide_id=None, course_id=None, course_content_id=None,
-        )
-        db_session.commit()
-
+        # Verify tasks in DB (flushed, and rolled back after the test)
+        tasks = rollback_session.query(Task).filter(Task.created_by_user_id == parent.id).all()
+        assert len(tasks) == 2
+
+    def test_assignee_lookup_does_not_repeat_per_date(self, rollback_session, task_data):
+        """Resolving who gets the tasks costs the same for one date as for many."""
+        def _count_selects(dates):
+            selects = []
+
+            def _record(conn, cursor, statement, parameters, context, executemany):
+                if statement.lstrip().upper().startswith("SELECT"):
+                    selects.append(statement)
+
+            conn = rollback_session.connection()
+            event.listen(conn, "before_cursor_execute", _record)
+            try:
+                created = auto_create_tasks_from_dates(
+                    rollback_session, dates, task_data["parent"],
+                    study_guide_id=None, course_id=None, course_content_id=None,
+                )
+            finally:
+                event.remove(conn, "before_cursor_execute", _record)
+            assert len(created) == len(dates)
+            return len(selects)
+
+        one = _count_selects([{"date": _days_ahead(1), "title": "Single Task", "priority": "low"}])
+        many = _count_selects([
+            {"date": _days_ahead(day), "title": f"Batch Task {day}", "priority": "low"}
+            for day in (2, 3, 4)
+        ])
+        assert many == one
+
+    @pytest.mark.parametrize("dates,expected", [
         # Only the valid date should create a task
-        assert len(created) == 1
-        assert created[0]["title"] == "Good Date Task"
-
-    def test_normalizes_invalid_priority(self, db_session, task_data):
-        from app.api.routes.study import auto_create_tasks_from_dates
-
-        parent = task_data["parent"]
-        dates = [
-            {"date": "2026-06-01", "title": "Weird Priority", "priority": "urgent"},
-        ]
-        created = auto_create_tasks_from_dates(
-            db_session, dates, parent,
-            study_guide_id=None, course_id=None, course_content_id=None,
-        )
-        db_session.commit()
-
-        assert len(created) == 1
-        assert created[0]["priority"] == "medium"
-
-    def test_empty_dates_list(self, db_session, task_data):
-        from app.api.routes.study import auto_create_tasks_from_dates
-
-        parent = task_data["parent"]
+        (
+            [
+                {"date": "not-a-date", "title": "Bad Date Task", "priority": "medium"},
+                {"date": _days_ahead(14), "title": "Good Date Task", "priority": "low"},
+            ],
+            [("Good Date Task", "low")],
+        ),
+        (
+            [{"date": _days_ahead(7), "title": "Weird Priority", "priority": "urgent"}],
+            [("Weird Priority", "medium")],
+        ),
+        ([], []),
+    ], ids=["skips_invalid_dates", "normalizes_invalid_priority", "empty_dates_list"])
+    def test_filters_dates(self, rollback_session, task_data, dates, expected):
         created = auto_create_tasks_from_dates(
-            db_session, [], parent,
+            rollback_session, dates, task_data["parent"],
             study_guide_id=None, course_id=None, course_content_id=None,
         )
-        assert created == []
+        assert [(t["title"], t["priority"]) for t in created] == expected
@@ -1,7 +1,28 @@
 """Tests for email verification (#417)."""
 from unittest.mock import patch
+
+import pytest
 from conftest import PASSWORD, _login, _auth
 
+# conftest has already loaded settings for the test environment, so the
+# token helper signs with the same secret key the app verifies against.
+from app.core.security import create_email_verification_token
+from app.models.user import User, UserRole
+
+
+@pytest.fixture(scope="module")
+def _patched_send():
+    """Patch the auth route's mailer once for the whole module."""
+    with patch("app.api.routes.auth.send_email_sync") as m:
+        yield m
+
+
+@pytest.fixture(autouse=True)
+def mock_send(_patched_send):
+    """The module's mailer mock, with calls from earlier tests cleared."""
+    _patched_send.reset_mock()
+    return _patched_send
+
 
 def _register(client, email, full_name="Test User", google_id=None):
     payload = {
@@ -12,14 +33,17 @@ def _register(client, email, full_name="Test User", google_id=None):
     return client.post("/api/auth/register", json=payload)
 
 
-def _make_verify_token(email):
-    """Import inside function to avoid early module import that breaks secret key alignment."""
-    from app.core.security import create_email_verification_token
-    return create_email_verification_token(email)
+def _seed_users(db, hashed_password, *emails, verified=False):
+    """Insert parent users directly, for tests where registration isn't the subject."""
+    db.add_all([
+        User(email=email, full_name="Test User", role=UserRole.PARENT,
+             hashed_password=hashed_password, email_verified=verified)
+        for email in emails
+    ])
+    db.commit()
 
 
 class TestRegistrationSendsVerification:
-    @patch("app.api.routes.auth.send_email_sync")
     def test_register_sends_verification_email(self, mock_send, client):
         resp = _register(client, "verify_send@test.com")
         assert resp.status_code == 200
@@ -30,7 +54,6 @@ class TestRegistrationSendsVerification:
         assert verify_call.kwargs["to_email"] == "verify_send@test.com"
         assert "Verify Your Email" in verify_call.kwargs["subject"]
 
-    @patch("app.api.routes.auth.send_email_sync")
     def test_google_signup_auto_verified(self, mock_send, client):
         resp = _register(client, "google_verify@test.com", google_id="gid-123")
         assert resp.status_code == 200
@@ -39,10 +62,21 @@ class TestRegistrationSendsVerification:
         mock_send.assert_not_called()
 
 
+@pytest.fixture(scope="session")
+def verify_tokens(seed_session, hashed_password):
+    """Seed the unverified users once and mint each one's verification token.
+
+    Registration itself (and the emails it sends) is covered by
+    ``TestRegistrationSendsVerification``.
+    """
+    emails = ["verify_valid@test.com", "verify_dup@test.com"]
+    _seed_users(seed_session, hashed_password, *emails)
+    return {email: create_email_verification_token(email) for email in emails}
+
+
 class TestVerifyEmailEndpoint:
-    def test_verify_valid_token(self, client):
-        _register(client, "verify_valid@test.com")
-        token = _make_verify_token("verify_valid@test.com")
+    def test_verify_valid_token(self, client, verify_tokens):
+        token = verify_tokens["verify_valid@test.com"]
 
         resp = client.post("/api/auth/verify-email", json={"token": token})
         assert resp.status_code == 200
@@ -59,9 +93,8 @@ class TestVerifyEmailEndpoint:
         assert resp.status_code == 400
         assert "invalid or expired" in resp.json()["detail"].lower()
 
-    def test_verify_already_verified(self, client):
-        _register(client, "verify_dup@test.com")
-        token = _make_verify_token("verify_dup@test.com")
+    def test_verify_already_verified(self, client, verify_tokens):
+        token = verify_tokens["verify_dup@test.com"]
 
         # Verify once
         client.post("/api/auth/verify-email", json={"token": token})
@@ -71,7 +104,7 @@ class TestVerifyEmailEndpoint:
         assert "already verified" in resp.json()["message"].lower()
 
     def test_verify_nonexistent_email(self, client):
-        token = _make_verify_token("nobody@test.com")
+        token = create_email_verification_token("nobody@test.com")
         resp = client.post("/api/auth/verify-email", json={"token": token})
         assert resp.status_code == 400
 
@@ -81,10 +114,8 @@ class TestResendVerification:
         resp = client.post("/api/auth/resend-verification")
         assert resp.status_code == 401
 
-    @patch("app.api.routes.auth.send_email_sync")
-    def test_resend_sends_email(self, mock_send, client):
-        _register(client, "resend@test.com")
-        mock_send.reset_mock()  # Clear the registration send
+    def test_resend_sends_email(self, mock_send, client, db_session, hashed_password):
+        _seed_users(db_session, hashed_password, "resend@test.com")
         headers = _auth(client, "resend@test.com")
 
         resp = client.post("/api/auth/resend-verification", headers=headers)
@@ -92,12 +123,8 @@ class TestResendVerification:
         assert "sent" in resp.json()["message"].lower()
         mock_send.assert_called_once()
 
-    def test_resend_rejected_if_already_verified(self, client):
-        _register(client, "resend_done@test.com")
-        # Verify email first
-        token = _make_verify_token("resend_done@test.com")
-        client.post("/api/auth/verify-email", json={"token": token})
-
+    def test_resend_rejected_if_already_verified(self, client, db_session, hashed_password):
+        _seed_users(db_session, hashed_password, "resend_done@test.com", verified=True)
         headers = _auth(client, "resend_done@test.com")
         resp = client.post("/api/auth/resend-verification", headers=headers)
         assert resp.status_code == 400
@@ -105,16 +132,16 @@ class TestResendVerification:
 
 
 class TestMeIncludesEmailVerified:
-    def test_me_returns_email_verified_false(self, client):
-        _register(client, "me_unverified@test.com")
+    def test_me_returns_email_verified_false(self, client, db_session, hashed_password):
+        _seed_users(db_session, hashed_password, "me_unverified@test.com")
         headers = _auth(client, "me_unverified@test.com")
         resp = client.get("/api/users/me", headers=headers)
         assert resp.status_code == 200
         assert resp.json()["email_verified"] is False
 
-    def test_me_returns_email_verified_true_after_verify(self, client):
-        _register(client, "me_verified@test.com")
-        token = _make_verify_token("me_verified@test.com")
+    def test_me_returns_email_verified_true_after_verify(self, client, db_session, hashed_password):
+        _seed_users(db_session, hashed_password, "me_verified@test.com")
+        token = create_email_verification_token("me_verified@test.com")
         client.post("/api/auth/verify-email", json={"token": token})
 
         headers = _auth(client, "me_verified@test.com")
@@ -124,7 +151,6 @@ class TestMeIncludesEmailVerified:
 
 
 class TestWelcomeEmail:
-    @patch("app.api.routes.auth.send_email_sync")
     def test_register_sends_welcome_email(self, mock_send, client):
         resp = _register(client, "welcome_test@test.com")
         assert resp.status_code == 200
@@ -134,7 +160,6 @@ class TestWelcomeEmail:
         assert welcome_call.kwargs["to_email"] == "welcome_test@test.com"
         assert "Welcome" in welcome_call.kwargs["subject"]
 
-    @patch("app.api.routes.auth.send_email_sync")
     def test_google_signup_skips_welcome_email(self, mock_send, client):
         resp = _register(client, "google_welcome@test.com", google_id="gid-welcome")
         assert resp.status_code == 200
@@ -142,12 +167,10 @@ class TestWelcomeEmail:
 
 
 class TestVerificationAckEmail:
-    @patch("app.api.routes.auth.send_email_sync")
-    def test_verify_sends_ack_email(self, mock_send, client):
-        _register(client, "ack_test@test.com")
-        mock_send.reset_mock()  # Clear registration emails
+    def test_verify_sends_ack_email(self, mock_send, client, db_session, hashed_password):
+        _seed_users(db_session, hashed_password, "ack_test@test.com")
 
-        token = _make_verify_token("ack_test@test.com")
+        token = create_email_verification_token("ack_test@test.com")
         resp = client.post("/api/auth/verify-email", json={"token": token})
         assert resp.status_code == 200
         assert resp.json()["message"] == "Email verified successfully"
@@ -156,10 +179,9 @@ class TestVerificationAckEmail:
         assert call_args.kwargs["to_email"] == "ack_test@test.com"
         assert "Verified" in call_args.kwargs["subject"]
 
-    @patch("app.api.routes.auth.send_email_sync")
-    def test_already_verified_skips_ack_email(self, mock_send, client):
-        _register(client, "ack_dup@test.com")
-        token = _make_verify_token("ack_dup@test.com")
+    def test_already_verified_skips_ack_email(self, mock_send, client, db_session, hashed_password):
+        _seed_users(db_session, hashed_password, "ack_dup@test.com")
+        token = create_email_verification_token("ack_dup@test.com")
         # Verify once
         client.post("/api/auth/verify-email", json={"token": token})
         mock_send.reset_mock()  # Clear all previous emails
@@ -170,7 +192,6 @@ class TestVerificationAckEmail:
         assert "already verified" in resp.json()["message"].lower()
         mock_send.assert_not_called()
 
-    @patch("app.api.routes.auth.send_email_sync")
     def test_invalid_token_skips_ack_email(self, mock_send, client):
         resp = client.post("/api/auth/verify-email", json={"token": "bad-token"})
         assert resp.status_code == 400
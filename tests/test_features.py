@@ -6,13 +6,7 @@ login loop fix) and return expected config-based flags.
 
 import pytest
 
-from conftest import PASSWORD, _auth
-
-
-def _register(client, email, role="parent", full_name="Test User"):
-    return client.post("/api/auth/register", json={
-        "email": email, "password": PASSWORD, "full_name": full_name, "role": role,
-    })
+from conftest import PASSWORD, _register, _auth
 
 
 def test_features_unauthenticated(client):
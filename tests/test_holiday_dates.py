@@ -1,19 +1,13 @@
 """Tests for holiday_dates CRUD endpoints (#2024)."""
 
 import pytest
-from conftest import PASSWORD, _auth
+from conftest import _register, _auth
 
 
 ADMIN_EMAIL = "hol_admin@test.com"
 USER_EMAIL = "hol_user@test.com"
 
 
-def _register(client, email, role="parent", full_name="Test User"):
-    return client.post("/api/auth/register", json={
-        "email": email, "password": PASSWORD, "full_name": full_name, "role": role,
-    })
-
-
 @pytest.fixture(autouse=True)
 def _setup_users(client, db_session):
     """Create an admin and a regular user for tests via API or DB."""
@@ -1,57 +1,49 @@
 import pytest
-from conftest import PASSWORD, _login, _auth
-
-
-@pytest.fixture()
-def users(db_session):
-    from app.core.security import get_password_hash
-    from app.models.user import User, UserRole
-
-    admin = db_session.query(User).filter(User.email == "insp_admin@test.com").first()
-    if admin:
-        parent = db_session.query(User).filter(User.email == "insp_parent@test.com").first()
-        teacher = db_session.query(User).filter(User.email == "insp_teacher@test.com").first()
-        student = db_session.query(User).filter(User.email == "insp_student@test.com").first()
-        return {"admin": admin, "parent": parent, "teacher": teacher, "student": student}
-
-    hashed = get_password_hash(PASSWORD)
-    admin = User(email="insp_admin@test.com", full_name="Insp Admin", role=UserRole.ADMIN, hashed_password=hashed)
-    parent = User(email="insp_parent@test.com", full_name="Insp Parent", role=UserRole.PARENT, hashed_password=hashed)
-    teacher = User(email="insp_teacher@test.com", full_name="Insp Teacher", role=UserRole.TEACHER, hashed_password=hashed)
-    student = User(email="insp_student@test.com", full_name="Insp Student", role=UserRole.STUDENT, hashed_password=hashed)
-    db_session.add_all([admin, parent, teacher, student])
-    db_session.commit()
-
-    for u in [admin, parent, teacher, student]:
-        db_session.refresh(u)
-
+from conftest import _login, _auth
+from sqlalchemy import insert
+
+from app.models.inspiration_message import InspirationMessage
+from app.models.user import User, UserRole
+
+
+@pytest.fixture(scope="session")
+def users(seed_session, hashed_password):
+    """Seed one user per role once; every test in the module shares them."""
+    admin = User(email="insp_admin@test.com", full_name="Insp Admin", role=UserRole.ADMIN, hashed_password=hashed_password)
+    parent = User(email="insp_parent@test.com", full_name="Insp Parent", role=UserRole.PARENT, hashed_password=hashed_password)
+    teacher = User(email="insp_teacher@test.com", full_name="Insp Teacher", role=UserRole.TEACHER, hashed_password=hashed_password)
+    student = User(email="insp_student@test.com", full_name="Insp Student", role=UserRole.STUDENT, hashed_password=hashed_password)
+    seed_session.add_all([admin, parent, teacher, student])
+    seed_session.commit()
     return {"admin": admin, "parent": parent, "teacher": teacher, "student": student}
 
 
 @pytest.fixture()
-def seed_messages(db_session):
-    """Seed some test messages into the DB."""
-    from app.models.inspiration_message import InspirationMessage
-
-    msgs = [
-        InspirationMessage(role="parent", text="Parent msg 1", author="Author A", is_active=True),
-        InspirationMessage(role="parent", text="Parent msg 2", author=None, is_active=True),
-        InspirationMessage(role="teacher", text="Teacher msg 1", author="Author B", is_active=True),
-        InspirationMessage(role="student", text="Student msg 1", author=None, is_active=True),
-        InspirationMessage(role="parent", text="Inactive parent msg", author=None, is_active=False),
-    ]
-    db_session.add_all(msgs)
+def seed_message_ids(db_session):
+    """Seed some test messages into the DB; returns their ids keyed by text.
+
+    One multi-row INSERT ... RETURNING. Keying by text keeps it independent
+    of the order the backend returns rows in, and nothing is loaded back.
+    """
+    rows = db_session.execute(
+        insert(InspirationMessage).returning(InspirationMessage.text, InspirationMessage.id),
+        [
+            {"role": "parent", "text": "Parent msg 1", "author": "Author A", "is_active": True},
+            {"role": "parent", "text": "Parent msg 2", "author": None, "is_active": True},
+            {"role": "teacher", "text": "Teacher msg 1", "author": "Author B", "is_active": True},
+            {"role": "student", "text": "Student msg 1", "author": None, "is_active": True},
+            {"role": "parent", "text": "Inactive parent msg", "author": None, "is_active": False},
+        ],
+    ).all()
     db_session.commit()
-    for m in msgs:
-        db_session.refresh(m)
-    return msgs
+    return dict(rows)
 
 
 # ── GET /api/inspiration/random ─────────────────────────────
 
 
 class TestRandomMessage:
-    def test_parent_gets_parent_message(self, client, users, seed_messages):
+    def test_parent_gets_parent_message(self, client, users, seed_message_ids):
         headers = _auth(client, users["parent"].email)
         resp = client.get("/api/inspiration/random", headers=headers)
         assert resp.status_code == 200
@@ -59,21 +51,21 @@ class TestRandomMessage:
         assert data["role"] == "parent"
         assert "Parent msg" in data["text"]
 
-    def test_teacher_gets_teacher_message(self, client, users, seed_messages):
+    def test_teacher_gets_teacher_message(self, client, users, seed_message_ids):
         headers = _auth(client, users["teacher"].email)
         resp = client.get("/api/inspiration/random", headers=headers)
         assert resp.status_code == 200
         data = resp.json()
         assert data["role"] == "teacher"
 
-    def test_student_gets_student_message(self, client, users, seed_messages):
+    def test_student_gets_student_message(self, client, users, seed_message_ids):
         headers = _auth(client, users["student"].email)
         resp = client.get("/api/inspiration/random", headers=headers)
         assert resp.status_code == 200
         data = resp.json()
         assert data["role"] == "student"
 
-    def test_inactive_not_returned(self, client, users, seed_messages):
+    def test_inactive_not_returned(self, client, users, seed_message_ids):
         """Parent should never get the inactive message."""
         headers = _auth(client, users["parent"].email)
         for _ in range(20):
@@ -87,14 +79,14 @@ class TestRandomMessage:
 
 
 class TestAdminCRUD:
-    def test_list_messages(self, client, users, seed_messages):
+    def test_list_messages(self, client, users, seed_message_ids):
         headers = _auth(client, users["admin"].email)
         resp = client.get("/api/inspiration/messages", headers=headers)
         assert resp.status_code == 200
         data = resp.json()
         assert len(data) >= 5
 
-    def test_list_filter_by_role(self, client, users, seed_messages):
+    def test_list_filter_by_role(self, client, users, seed_message_ids):
         headers = _auth(client, users["admin"].email)
         resp = client.get("/api/inspiration/messages?role=teacher", headers=headers)
         assert resp.status_code == 200
@@ -123,27 +115,27 @@ class TestAdminCRUD:
         }, headers=headers)
         assert resp.status_code == 400
 
-    def test_update_message(self, client, users, seed_messages):
+    def test_update_message(self, client, users, seed_message_ids):
         headers = _auth(client, users["admin"].email)
-        msg_id = seed_messages[0].id
+        msg_id = seed_message_ids["Parent msg 1"]
         resp = client.patch(f"/api/inspiration/messages/{msg_id}", json={
             "text": "Updated message text",
         }, headers=headers)
         assert resp.status_code == 200
         assert resp.json()["text"] == "Updated message text"
 
-    def test_toggle_active(self, client, users, seed_messages):
+    def test_toggle_active(self, client, users, seed_message_ids):
         headers = _auth(client, users["admin"].email)
-        msg_id = seed_messages[0].id
+        msg_id = seed_message_ids["Parent msg 1"]
         resp = client.patch(f"/api/inspiration/messages/{msg_id}", json={
             "is_active": False,
         }, headers=headers)
         assert resp.status_code == 200
         assert resp.json()["is_active"] is False
 
-    def test_delete_message(self, client, users, seed_messages):
+    def test_delete_message(self, client, users, seed_message_ids):
         headers = _auth(client, users["admin"].email)
-        msg_id = seed_messages[3].id  # student msg
+        msg_id = seed_message_ids["Student msg 1"]
         resp = client.delete(f"/api/inspiration/messages/{msg_id}", headers=headers)
         assert resp.status_code == 200
 
@@ -175,7 +167,7 @@ class TestSeedEndpoint:
         resp = client.post("/api/inspiration/seed", headers=headers)
         assert resp.status_code == 403
 
-    def test_seed_skips_if_not_empty(self, client, users, seed_messages):
+    def test_seed_skips_if_not_empty(self, client, users, seed_message_ids):
         headers = _auth(client, users["admin"].email)
         resp = client.post("/api/inspiration/seed", headers=headers)
         assert resp.status_code == 200
@@ -1,28 +1,18 @@
 import pytest
-from conftest import PASSWORD, _login, _auth
-
-
-@pytest.fixture()
-def users(db_session):
-    from app.core.security import get_password_hash
-    from app.models.user import User, UserRole
-
-    parent = db_session.query(User).filter(User.email == "inv_parent@test.com").first()
-    if parent:
-        teacher = db_session.query(User).filter(User.email == "inv_teacher@test.com").first()
-        student = db_session.query(User).filter(User.email == "inv_student@test.com").first()
-        admin = db_session.query(User).filter(User.email == "inv_admin@test.com").first()
-        return {"parent": parent, "teacher": teacher, "student": student, "admin": admin}
-
-    hashed = get_password_hash(PASSWORD)
-    parent = User(email="inv_parent@test.com", full_name="Inv Parent", role=UserRole.PARENT, hashed_password=hashed)
-    teacher = User(email="inv_teacher@test.com", full_name="Inv Teacher", role=UserRole.TEACHER, hashed_password=hashed)
-    student = User(email="inv_student@test.com", full_name="Inv Student", role=UserRole.STUDENT, hashed_password=hashed)
-    admin = User(email="inv_admin@test.com", full_name="Inv Admin", role=UserRole.ADMIN, hashed_password=hashed)
-    db_session.add_all([parent, teacher, student, admin])
-    db_session.commit()
-    for u in [parent, teacher, student, admin]:
-        db_session.refresh(u)
+from conftest import _login, _auth
+
+from app.models.user import User, UserRole
+
+
+@pytest.fixture(scope="session")
+def users(seed_session, hashed_password):
+    """Seed one user per role once; every test in the module shares them."""
+    parent = User(email="inv_parent@test.com", full_name="Inv Parent", role=UserRole.PARENT, hashed_password=hashed_password)
+    teacher = User(email="inv_teacher@test.com", full_name="Inv Teacher", role=UserRole.TEACHER, hashed_password=hashed_password)
+    student = User(email="inv_student@test.com", full_name="Inv Student", role=UserRole.STUDENT, hashed_password=hashed_password)
+    admin = User(email="inv_admin@test.com", full_name="Inv Admin", role=UserRole.ADMIN, hashed_password=hashed_password)
+    seed_session.add_all([parent, teacher, student, admin])
+    seed_session.commit()
     return {"parent": parent, "teacher": teacher, "student": student, "admin": admin}
 
 
@@ -129,16 +119,13 @@ class TestListSentInvites:
         for invite in resp.json():
             assert invite["invited_by_user_id"] == users["teacher"].id
 
-    def test_empty_list(self, client, users, db_session):
+    def test_empty_list(self, client, users, db_session, hashed_password):
         """A user who hasn't sent invites should see an empty list."""
-        from app.core.security import get_password_hash
-        from app.models.user import User, UserRole
-
         email = "inv_empty@test.com"
         u = db_session.query(User).filter(User.email == email).first()
         if not u:
             u = User(email=email, full_name="No Invites", role=UserRole.PARENT,
-                     hashed_password=get_password_hash(PASSWORD))
+                     hashed_password=hashed_password)
             db_session.add(u)
             db_session.commit()
 
@@ -214,8 +214,7 @@ class TestMaterialUploadAudit:
 class TestAuditEntryDetails:
     def test_audit_entry_has_ip_and_user_agent(self, client, db_session, users):
         content = _create_content(client, users)
-        headers = _auth(client, users["teacher"].email)
-        headers["User-Agent"] = "TestAgent/1.0"
+        headers = {**_auth(client, users["teacher"].email), "User-Agent": "TestAgent/1.0"}
 
         resp = client.get(f"/api/course-contents/{content['id']}", headers=headers)
         assert resp.status_code == 200
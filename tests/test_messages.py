@@ -1,10 +1,9 @@
 import pytest
-from conftest import PASSWORD, _login, _auth
+from conftest import _login, _auth
 
 
 @pytest.fixture()
-def msg_users(db_session):
-    from app.core.security import get_password_hash
+def msg_users(db_session, hashed_password):
     from app.models.user import User, UserRole
     from app.models.student import Student, parent_students, RelationshipType
     from app.models.teacher import Teacher
@@ -17,10 +16,9 @@ def msg_users(db_session):
         student = db_session.query(User).filter(User.email == "msg_student@test.com").first()
         return {"parent": parent, "teacher": teacher, "student": student}
 
-    hashed = get_password_hash(PASSWORD)
-    parent = User(email="msg_parent@test.com", full_name="Msg Parent", role=UserRole.PARENT, hashed_password=hashed)
-    teacher = User(email="msg_teacher@test.com", full_name="Msg Teacher", role=UserRole.TEACHER, hashed_password=hashed)
-    student = User(email="msg_student@test.com", full_name="Msg Student", role=UserRole.STUDENT, hashed_password=hashed)
+    parent = User(email="msg_parent@test.com", full_name="Msg Parent", role=UserRole.PARENT, hashed_password=hashed_password)
+    teacher = User(email="msg_teacher@test.com", full_name="Msg Teacher", role=UserRole.TEACHER, hashed_password=hashed_password)
+    student = User(email="msg_student@test.com", full_name="Msg Student", role=UserRole.STUDENT, hashed_password=hashed_password)
     db_session.add_all([parent, teacher, student])
     db_session.flush()
 
@@ -49,17 +47,16 @@ def msg_users(db_session):
 
 # ── Existing tests ──────────────────────────────────────────
 
-def test_unread_count_and_mark_read(client, db_session):
-    from app.core.security import get_password_hash
+def test_unread_count_and_mark_read(client, db_session, hashed_password):
     from app.models.message import Conversation, Message
     from app.models.user import User, UserRole
 
     user_a = db_session.query(User).filter(User.email == "usera@example.com").first()
     if not user_a:
         user_a = User(email="usera@example.com", full_name="User A", role=UserRole.PARENT,
-                      hashed_password=get_password_hash(PASSWORD))
+                      hashed_password=hashed_password)
         user_b = User(email="userb@example.com", full_name="User B", role=UserRole.TEACHER,
-                      hashed_password=get_password_hash(PASSWORD))
+                      hashed_password=hashed_password)
         db_session.add_all([user_a, user_b])
         db_session.commit()
     else:
@@ -569,16 +566,15 @@ class TestRecipientSearch:
         ids = [r["user_id"] for r in results]
         assert msg_users["parent"].id not in ids
 
-    def test_recipients_without_q_returns_linked_only(self, client, msg_users, db_session):
+    def test_recipients_without_q_returns_linked_only(self, client, msg_users, db_session, hashed_password):
         """Without q, returns connected users + admins (no unlinked users)."""
-        from app.core.security import get_password_hash
         from app.models.user import User, UserRole
 
         unlinked = db_session.query(User).filter(User.email == "unlinked_recip@test.com").first()
         if not unlinked:
             unlinked = User(
                 email="unlinked_recip@test.com", full_name="Unlinked Recipient",
-                role=UserRole.PARENT, hashed_password=get_password_hash(PASSWORD),
+                role=UserRole.PARENT, hashed_password=hashed_password,
             )
             db_session.add(unlinked)
             db_session.commit()
@@ -595,16 +591,15 @@ class TestRecipientSearch:
 # ── Relaxed conversation creation (#956) ──────────────────
 
 class TestCreateConversationRelaxed:
-    def test_cannot_message_unlinked_user(self, client, msg_users, db_session):
+    def test_cannot_message_unlinked_user(self, client, msg_users, db_session, hashed_password):
         """Parent cannot message an unlinked parent (role-based restriction #2408)."""
-        from app.core.security import get_password_hash
         from app.models.user import User, UserRole
 
         unlinked = db_session.query(User).filter(User.email == "unlinked_conv@test.com").first()
         if not unlinked:
             unlinked = User(
                 email="unlinked_conv@test.com", full_name="Unlinked Conv User",
-                role=UserRole.PARENT, hashed_password=get_password_hash(PASSWORD),
+                role=UserRole.PARENT, hashed_password=hashed_password,
             )
             db_session.add(unlinked)
             db_session.commit()
@@ -626,16 +621,15 @@ class TestCreateConversationRelaxed:
         }, headers=headers)
         assert resp.status_code == 400
 
-    def test_cannot_message_inactive_user(self, client, msg_users, db_session):
+    def test_cannot_message_inactive_user(self, client, msg_users, db_session, hashed_password):
         """Inactive users should not be valid recipients."""
-        from app.core.security import get_password_hash
         from app.models.user import User, UserRole
 
         inactive = db_session.query(User).filter(User.email == "inactive_msg@test.com").first()
         if not inactive:
             inactive = User(
                 email="inactive_msg@test.com", full_name="Inactive Msg User",
-                role=UserRole.PARENT, hashed_password=get_password_hash(PASSWORD),
+                role=UserRole.PARENT, hashed_password=hashed_password,
                 is_active=False,
             )
             db_session.add(inactive)
@@ -653,7 +647,7 @@ class TestCreateConversationRelaxed:
 # ── Role-based messaging authorization (#2417) ────────────
 
 @pytest.fixture()
-def auth_users(db_session):
+def auth_users(db_session, hashed_password):
     """Create a full set of users with relationships for authorization tests.
 
     Relationships:
@@ -665,20 +659,17 @@ def auth_users(db_session):
     - teacher2 teaches course2 (with student3 only, no overlap)
     - admin1 is an admin
     """
-    from app.core.security import get_password_hash
     from app.models.user import User, UserRole
     from app.models.student import Student, parent_students, RelationshipType
     from app.models.teacher import Teacher
     from app.models.course import Course, student_courses
     from sqlalchemy import insert
 
-    hashed = get_password_hash(PASSWORD)
-
     def _get_or_create(email, full_name, role, **kwargs):
         u = db_session.query(User).filter(User.email == email).first()
         if not u:
             u = User(email=email, full_name=full_name, role=role,
-                     hashed_password=hashed, **kwargs)
+                     hashed_password=hashed_password, **kwargs)
             db_session.add(u)
             db_session.flush()
         return u
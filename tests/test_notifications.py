@@ -1,10 +1,9 @@
 import pytest
-from conftest import PASSWORD, _login, _auth
+from conftest import _login, _auth
 
 
 @pytest.fixture()
-def notif_user(db_session):
-    from app.core.security import get_password_hash
+def notif_user(db_session, hashed_password):
     from app.models.user import User, UserRole
 
     email = "notif_user@test.com"
@@ -13,7 +12,7 @@ def notif_user(db_session):
         return user
     user = User(
         email=email, full_name="Notif User", role=UserRole.PARENT,
-        hashed_password=get_password_hash(PASSWORD),
+        hashed_password=hashed_password,
     )
     db_session.add(user)
     db_session.commit()
@@ -23,8 +22,7 @@ def notif_user(db_session):
 
 # ── Original tests ────────────────────────────────────────────
 
-def test_notifications_unread_and_mark_read(client, db_session):
-    from app.core.security import get_password_hash
+def test_notifications_unread_and_mark_read(client, db_session, hashed_password):
     from app.models.notification import Notification, NotificationType
     from app.models.user import User, UserRole
 
@@ -34,7 +32,7 @@ def test_notifications_unread_and_mark_read(client, db_session):
             email="notify@example.com",
             full_name="Notify User",
             role=UserRole.PARENT,
-            hashed_password=get_password_hash("Password123!"),
+            hashed_password=hashed_password,
         )
         db_session.add(user)
         db_session.commit()
@@ -45,16 +45,11 @@ def users(db_session):
     db_session.add_all([student_rec, teacher_rec])
     db_session.flush()
 
-    # Link parent → student
-    db_session.execute(insert(parent_students).values(
-        parent_id=parent.id, student_id=student_rec.id,
-        relationship_type=RelationshipType.GUARDIAN,
-    ))
-    # Link parent2 → same student (second parent scenario)
-    db_session.execute(insert(parent_students).values(
-        parent_id=parent2.id, student_id=student_rec.id,
-        relationship_type=RelationshipType.GUARDIAN,
-    ))
+    # Link parent → student, and parent2 → same student (second parent scenario)
+    db_session.execute(insert(parent_students), [
+        {"parent_id": pid, "student_id": student_rec.id, "relationship_type": RelationshipType.GUARDIAN}
+        for pid in (parent.id, parent2.id)
+    ])
 
     # Create course, enroll student
     course = Course(name="SG Test Course", teacher_id=teacher_rec.id,
@@ -62,8 +62,10 @@ def users(db_session):
     db_session.commit()
 
     # Both parents linked to the same child
-    db_session.execute(parent_students.insert().values(parent_id=parent.id, student_id=student.id))
-    db_session.execute(parent_students.insert().values(parent_id=second_parent.id, student_id=student.id))
+    db_session.execute(parent_students.insert(), [
+        {"parent_id": parent.id, "student_id": student.id},
+        {"parent_id": second_parent.id, "student_id": student.id},
+    ])
     db_session.commit()
 
     teacher = Teacher(user_id=teacher_user.id)
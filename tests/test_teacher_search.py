@@ -11,65 +11,43 @@ master where no role restriction exists yet — that is expected.
 """
 
 import pytest
-from conftest import PASSWORD, _auth
-
-
-@pytest.fixture()
-def search_users(db_session):
-    from app.core.security import get_password_hash
-    from app.models.user import User, UserRole
-    from app.models.teacher import Teacher
-
-    # Check if fixture data already exists (db persists across function-scoped sessions)
-    existing = db_session.query(User).filter(User.email == "tsearch_parent@test.com").first()
-    if existing:
-        return {
-            "parent": existing,
-            "student": db_session.query(User).filter(User.email == "tsearch_student@test.com").one(),
-            "teacher_user": db_session.query(User).filter(User.email == "tsearch_teacher@test.com").one(),
-            "admin": db_session.query(User).filter(User.email == "tsearch_admin@test.com").one(),
-            "platform_teacher": db_session.query(Teacher).filter(
-                Teacher.user_id == db_session.query(User).filter(
-                    User.email == "tsearch_teacher@test.com"
-                ).one().id
-            ).one(),
-            "shadow_teacher": db_session.query(Teacher).filter(
-                Teacher.google_email == "shadow.smith@school.edu"
-            ).one(),
-        }
-
-    hashed = get_password_hash(PASSWORD)
+from conftest import _auth
 
+from app.models.teacher import Teacher
+from app.models.user import User, UserRole
+
+
+@pytest.fixture(scope="session")
+def search_users(seed_session, hashed_password):
+    """Seed the search users and both teacher kinds once for the session."""
     parent = User(
         email="tsearch_parent@test.com",
         full_name="Search Parent",
         role=UserRole.PARENT,
-        hashed_password=hashed,
+        hashed_password=hashed_password,
     )
     student = User(
         email="tsearch_student@test.com",
         full_name="Search Student",
         role=UserRole.STUDENT,
-        hashed_password=hashed,
+        hashed_password=hashed_password,
     )
     teacher_user = User(
         email="tsearch_teacher@test.com",
         full_name="Search Teacher",
         role=UserRole.TEACHER,
-        hashed_password=hashed,
+        hashed_password=hashed_password,
     )
     admin = User(
         email="tsearch_admin@test.com",
         full_name="Search Admin",
         role=UserRole.ADMIN,
-        hashed_password=hashed,
+        hashed_password=hashed_password,
     )
-    db_session.add_all([parent, student, teacher_user, admin])
-    db_session.flush()
 
     # Platform teacher (linked to a User)
     platform_teacher = Teacher(
-        user_id=teacher_user.id,
+        user=teacher_user,
         is_shadow=False,
         is_platform_user=True,
     )
@@ -81,13 +59,8 @@ def search_users(db_session):
         google_email="shadow.smith@school.edu",
         full_name="Shadow Smith",
     )
-    db_session.add_all([platform_teacher, shadow_teacher])
-    db_session.commit()
-
-    for u in [parent, student, teacher_user, admin]:
-        db_session.refresh(u)
-    db_session.refresh(platform_teacher)
-    db_session.refresh(shadow_teacher)
+    seed_session.add_all([parent, student, admin, platform_teacher, shadow_teacher])
+    seed_session.commit()
 
     return {
         "parent": parent,
@@ -159,7 +159,7 @@ def _backdate_last_entry(db_session, student_id, seconds=61):
     last = (
         db_session.query(XpLedger)
         .filter(XpLedger.student_id == student_id)
-        .order_by(XpLedger.created_at.desc())
+        .order_by(XpLedger.id.desc())
         .first()
     )
     if last:
@@ -379,7 +379,7 @@ def test_brownie_award_creates_ledger_entry(db_session, xp_users):
             XpLedger.action_type == "brownie_points",
             XpLedger.awarder_id == xp_users["parent"].id,
         )
-        .order_by(XpLedger.created_at.desc())
+        .order_by(XpLedger.id.desc())
         .first()
     )
     assert entry is not None